@@ -926,35 +926,34 @@ def run_analysis():
                 ):
                     debate_state = chunk["investment_debate_state"]
 
+                    # Latest turn of each researcher, from the debate's turn log
+                    latest_turns = {}
+                    for turn in debate_state.get("turns", []):
+                        latest_turns[turn["speaker"]] = turn
+
                     # Update Bull Researcher status and report
-                    if "bull_history" in debate_state and debate_state["bull_history"]:
+                    if "Bull" in latest_turns:
                         # Keep all research team members in progress
                         update_research_team_status("in_progress")
-                        # Extract latest bull response
-                        bull_responses = debate_state["bull_history"].split("\n")
-                        latest_bull = bull_responses[-1] if bull_responses else ""
-                        if latest_bull:
-                            message_buffer.add_message("Reasoning", latest_bull)
-                            # Update research report with bull's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"### Bull Researcher Analysis\n{latest_bull}",
-                            )
+                        latest_bull = f"Bull Analyst: {latest_turns['Bull']['content']}"
+                        message_buffer.add_message("Reasoning", latest_bull)
+                        # Update research report with bull's latest analysis
+                        message_buffer.update_report_section(
+                            "investment_plan",
+                            f"### Bull Researcher Analysis\n{latest_bull}",
+                        )
 
                     # Update Bear Researcher status and report
-                    if "bear_history" in debate_state and debate_state["bear_history"]:
+                    if "Bear" in latest_turns:
                         # Keep all research team members in progress
                         update_research_team_status("in_progress")
-                        # Extract latest bear response
-                        bear_responses = debate_state["bear_history"].split("\n")
-                        latest_bear = bear_responses[-1] if bear_responses else ""
-                        if latest_bear:
-                            message_buffer.add_message("Reasoning", latest_bear)
-                            # Update research report with bear's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"{message_buffer.report_sections['investment_plan']}\n\n### Bear Researcher Analysis\n{latest_bear}",
-                            )
+                        latest_bear = f"Bear Analyst: {latest_turns['Bear']['content']}"
+                        message_buffer.add_message("Reasoning", latest_bear)
+                        # Update research report with bear's latest analysis
+                        message_buffer.update_report_section(
+                            "investment_plan",
+                            f"{message_buffer.report_sections['investment_plan']}\n\n### Bear Researcher Analysis\n{latest_bear}",
+                        )
 
                     # Update Research Manager status and final decision
                     if (
@@ -1105,5 +1104,62 @@ def analyze():
     run_analysis()
 
 
+@app.command("convert-finnhub")
+def convert_finnhub(
+    data_dir: str = typer.Option(
+        DEFAULT_CONFIG["data_dir"], help="Directory containing the finnhub_data folder"
+    ),
+):
+    """Convert local finnhub JSON files into the memory-mapped, date-indexed format."""
+    from tradingagents.dataflows.finnhub_store import convert_finnhub_data
+
+    converted = convert_finnhub_data(data_dir)
+    console.print(f"[green]Converted {converted} finnhub files under {data_dir}[/green]")
+
+
+@app.command("index-reddit")
+def index_reddit(
+    data_dir: str = typer.Option(
+        DEFAULT_CONFIG["data_dir"], help="Directory containing the reddit_data folder"
+    ),
+):
+    """Bucket local reddit posts by date and subreddit and index ticker mentions."""
+    from tradingagents.dataflows.reddit_store import index_reddit_data
+
+    indexed = index_reddit_data(str(Path(data_dir) / "reddit_data"))
+    console.print(f"[green]Indexed {indexed} reddit posts under {data_dir}[/green]")
+
+
+@app.command("benchmark")
+def benchmark(
+    tickers: str = typer.Option("NVDA,AAPL,MSFT,AMZN", help="Comma-separated tickers"),
+    trade_date: str = typer.Option("2024-05-10", help="Trade date of every run"),
+    runs: int = typer.Option(5, help="Number of sequential runs"),
+    max_concurrency: int = typer.Option(4, help="Concurrency of the batch run"),
+    parallel_analysts: bool = typer.Option(False, help="Run the analysts as concurrent branches"),
+    use_async: bool = typer.Option(False, "--async", help="Run the batch on the asyncio path"),
+    llm_latency: float = typer.Option(0.0, help="Simulated seconds per LLM response"),
+    output: Optional[str] = typer.Option(None, help="Also write the full report as JSON to this path"),
+):
+    """Run the graph offline against a scripted LLM and fixture data to measure framework overhead."""
+    import json
+    from tradingagents.benchmarks import format_report, run_benchmark
+
+    report = run_benchmark(
+        tickers=[ticker.strip().upper() for ticker in tickers.split(",") if ticker.strip()],
+        trade_date=trade_date,
+        runs=runs,
+        max_concurrency=max_concurrency,
+        parallel_analysts=parallel_analysts,
+        use_async=use_async,
+        llm_latency=llm_latency,
+    )
+    console.print(format_report(report), markup=False, highlight=False)
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        console.print(f"[green]Wrote benchmark report to {output}[/green]")
+
+
 if __name__ == "__main__":
     app()
@@ -1,10 +1,13 @@
+import asyncio
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import prompt_history, render_histories
 import time
 import json
 
 
 def create_research_manager(llm, memory):
-    def research_manager_node(state) -> dict:
-        history = state["investment_debate_state"].get("history", "")
+    def build_prompt(state):
+        history = prompt_history(state["investment_debate_state"])
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
         news_report = state["news_report"]
@@ -13,7 +16,9 @@ def create_research_manager(llm, memory):
         investment_debate_state = state["investment_debate_state"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, ticker=state["company_of_interest"]
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -36,13 +41,19 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+
+        return prompt
+
+    def build_update(state, response):
+        investment_debate_state = state["investment_debate_state"]
 
         new_investment_debate_state = {
             "judge_decision": response.content,
-            "history": investment_debate_state.get("history", ""),
-            "bear_history": investment_debate_state.get("bear_history", ""),
-            "bull_history": investment_debate_state.get("bull_history", ""),
+            "turns": investment_debate_state.get("turns", []),
+            "summary": investment_debate_state.get("summary", ""),
+            "summarized_turns": investment_debate_state.get("summarized_turns", 0),
+            # Full transcripts, built once, for logging, reflection and reports
+            **render_histories(investment_debate_state, ["Bull", "Bear"]),
             "current_response": response.content,
             "count": investment_debate_state["count"],
         }
@@ -52,4 +63,13 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    def research_manager_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        return build_update(state, response)
+
+    async def aresearch_manager_node(state) -> dict:
+        prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(prompt)
+        return build_update(state, response)
+
+    return RunnableLambda(research_manager_node, afunc=aresearch_manager_node)
@@ -1,22 +1,27 @@
+import asyncio
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import prompt_history, render_histories
 import time
 import json
 
 
 def create_risk_manager(llm, memory):
-    def risk_manager_node(state) -> dict:
+    def build_prompt(state):
 
         company_name = state["company_of_interest"]
 
-        history = state["risk_debate_state"]["history"]
+        history = prompt_history(state["risk_debate_state"])
         risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
+        fundamentals_report = state["fundamentals_report"]
         sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, ticker=state["company_of_interest"]
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -43,14 +48,18 @@ Deliverables:
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def build_update(state, response):
+        risk_debate_state = state["risk_debate_state"]
 
         new_risk_debate_state = {
             "judge_decision": response.content,
-            "history": risk_debate_state["history"],
-            "risky_history": risk_debate_state["risky_history"],
-            "safe_history": risk_debate_state["safe_history"],
-            "neutral_history": risk_debate_state["neutral_history"],
+            "turns": risk_debate_state.get("turns", []),
+            "summary": risk_debate_state.get("summary", ""),
+            "summarized_turns": risk_debate_state.get("summarized_turns", 0),
+            # Full transcripts, built once, for logging, reflection and reports
+            **render_histories(risk_debate_state, ["Risky", "Safe", "Neutral"]),
             "latest_speaker": "Judge",
             "current_risky_response": risk_debate_state["current_risky_response"],
             "current_safe_response": risk_debate_state["current_safe_response"],
@@ -63,4 +72,13 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    def risk_manager_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        return build_update(state, response)
+
+    async def arisk_manager_node(state) -> dict:
+        prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(prompt)
+        return build_update(state, response)
+
+    return RunnableLambda(risk_manager_node, afunc=arisk_manager_node)
@@ -1,13 +1,20 @@
+import asyncio
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import (
+    aappend_turn,
+    append_turn,
+    prompt_history,
+)
+from tradingagents.agents.utils.shared_context import with_shared_context
 import time
 import json
 
 
 def create_bear_researcher(llm, memory):
-    def bear_node(state) -> dict:
+    def build_prompt(state):
         investment_debate_state = state["investment_debate_state"]
-        history = investment_debate_state.get("history", "")
-        bear_history = investment_debate_state.get("bear_history", "")
+        history = prompt_history(investment_debate_state)
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -16,7 +23,9 @@ def create_bear_researcher(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, ticker=state["company_of_interest"]
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -34,28 +43,41 @@ Key points to focus on:
 
 Resources available:
 
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
+The market research, social media sentiment, world affairs news and company fundamentals reports above.
 Conversation history of the debate: {history}
 Last bull argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        return with_shared_context(state, prompt)
+
+    def build_update(state, response, turn_log):
+        investment_debate_state = state["investment_debate_state"]
 
         argument = f"Bear Analyst: {response.content}"
 
         new_investment_debate_state = {
-            "history": history + "\n" + argument,
-            "bear_history": bear_history + "\n" + argument,
-            "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
+            **turn_log,
         }
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    def bear_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        turn_log = append_turn(
+            state["investment_debate_state"], "Bear", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    async def abear_node(state) -> dict:
+        prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(prompt)
+        turn_log = await aappend_turn(
+            state["investment_debate_state"], "Bear", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    return RunnableLambda(bear_node, afunc=abear_node)
@@ -1,13 +1,20 @@
+import asyncio
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import (
+    aappend_turn,
+    append_turn,
+    prompt_history,
+)
+from tradingagents.agents.utils.shared_context import with_shared_context
 import time
 import json
 
 
 def create_bull_researcher(llm, memory):
-    def bull_node(state) -> dict:
+    def build_prompt(state):
         investment_debate_state = state["investment_debate_state"]
-        history = investment_debate_state.get("history", "")
-        bull_history = investment_debate_state.get("bull_history", "")
+        history = prompt_history(investment_debate_state)
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -16,7 +23,9 @@ def create_bull_researcher(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, ticker=state["company_of_interest"]
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -32,28 +41,41 @@ Key points to focus on:
 - Engagement: Present your argument in a conversational style, engaging directly with the bear analyst's points and debating effectively rather than just listing data.
 
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
+The market research, social media sentiment, world affairs news and company fundamentals reports above.
 Conversation history of the debate: {history}
 Last bear argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        return with_shared_context(state, prompt)
+
+    def build_update(state, response, turn_log):
+        investment_debate_state = state["investment_debate_state"]
 
         argument = f"Bull Analyst: {response.content}"
 
         new_investment_debate_state = {
-            "history": history + "\n" + argument,
-            "bull_history": bull_history + "\n" + argument,
-            "bear_history": investment_debate_state.get("bear_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
+            **turn_log,
         }
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
+    def bull_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        turn_log = append_turn(
+            state["investment_debate_state"], "Bull", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    async def abull_node(state) -> dict:
+        prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(prompt)
+        turn_log = await aappend_turn(
+            state["investment_debate_state"], "Bull", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    return RunnableLambda(bull_node, afunc=abull_node)
@@ -1,21 +1,22 @@
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import (
+    aappend_turn,
+    append_turn,
+    prompt_history,
+)
+from tradingagents.agents.utils.shared_context import with_shared_context
 import time
 import json
 
 
 def create_risky_debator(llm):
-    def risky_node(state) -> dict:
+    def build_prompt(state):
         risk_debate_state = state["risk_debate_state"]
-        history = risk_debate_state.get("history", "")
-        risky_history = risk_debate_state.get("risky_history", "")
+        history = prompt_history(risk_debate_state)
 
         current_safe_response = risk_debate_state.get("current_safe_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
         trader_decision = state["trader_investment_plan"]
 
         prompt = f"""As the Risky Risk Analyst, your role is to actively champion high-reward, high-risk opportunities, emphasizing bold strategies and competitive advantages. When evaluating the trader's decision or plan, focus intently on the potential upside, growth potential, and innovative benefits—even when these come with elevated risk. Use the provided market data and sentiment analysis to strengthen your arguments and challenge the opposing views. Specifically, respond directly to each point made by the conservative and neutral analysts, countering with data-driven rebuttals and persuasive reasoning. Highlight where their caution might miss critical opportunities or where their assumptions may be overly conservative. Here is the trader's decision:
@@ -24,32 +25,46 @@ def create_risky_debator(llm):
 
 Your task is to create a compelling case for the trader's decision by questioning and critiquing the conservative and neutral stances to demonstrate why your high-reward perspective offers the best path forward. Incorporate insights from the following sources into your arguments:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
+The Market Research, Social Media Sentiment, Latest World Affairs and Company Fundamentals Reports shared above.
 Here is the current conversation history: {history} Here are the last arguments from the conservative analyst: {current_safe_response} Here are the last arguments from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return with_shared_context(state, prompt)
+
+    def build_update(state, response, turn_log):
+        risk_debate_state = state["risk_debate_state"]
 
         argument = f"Risky Analyst: {response.content}"
 
         new_risk_debate_state = {
-            "history": history + "\n" + argument,
-            "risky_history": risky_history + "\n" + argument,
-            "safe_history": risk_debate_state.get("safe_history", ""),
-            "neutral_history": risk_debate_state.get("neutral_history", ""),
             "latest_speaker": "Risky",
             "current_risky_response": argument,
-            "current_safe_response": risk_debate_state.get("current_safe_response", ""),
+            "current_safe_response": risk_debate_state.get(
+                "current_safe_response", ""
+            ),
             "current_neutral_response": risk_debate_state.get(
                 "current_neutral_response", ""
             ),
             "count": risk_debate_state["count"] + 1,
+            **turn_log,
         }
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return risky_node
+    def risky_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        turn_log = append_turn(
+            state["risk_debate_state"], "Risky", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    async def arisky_node(state) -> dict:
+        prompt = build_prompt(state)
+        response = await llm.ainvoke(prompt)
+        turn_log = await aappend_turn(
+            state["risk_debate_state"], "Risky", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    return RunnableLambda(risky_node, afunc=arisky_node)
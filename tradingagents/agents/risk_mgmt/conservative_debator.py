@@ -1,22 +1,23 @@
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from tradingagents.agents.utils.debate_history import (
+    aappend_turn,
+    append_turn,
+    prompt_history,
+)
+from tradingagents.agents.utils.shared_context import with_shared_context
 import time
 import json
 
 
 def create_safe_debator(llm):
-    def safe_node(state) -> dict:
+    def build_prompt(state):
         risk_debate_state = state["risk_debate_state"]
-        history = risk_debate_state.get("history", "")
-        safe_history = risk_debate_state.get("safe_history", "")
+        history = prompt_history(risk_debate_state)
 
         current_risky_response = risk_debate_state.get("current_risky_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
         trader_decision = state["trader_investment_plan"]
 
         prompt = f"""As the Safe/Conservative Risk Analyst, your primary objective is to protect assets, minimize volatility, and ensure steady, reliable growth. You prioritize stability, security, and risk mitigation, carefully assessing potential losses, economic downturns, and market volatility. When evaluating the trader's decision or plan, critically examine high-risk elements, pointing out where the decision may expose the firm to undue risk and where more cautious alternatives could secure long-term gains. Here is the trader's decision:
@@ -25,23 +26,19 @@ def create_safe_debator(llm):
 
 Your task is to actively counter the arguments of the Risky and Neutral Analysts, highlighting where their views may overlook potential threats or fail to prioritize sustainability. Respond directly to their points, drawing from the following data sources to build a convincing case for a low-risk approach adjustment to the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
+The Market Research, Social Media Sentiment, Latest World Affairs and Company Fundamentals Reports shared above.
 Here is the current conversation history: {history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return with_shared_context(state, prompt)
+
+    def build_update(state, response, turn_log):
+        risk_debate_state = state["risk_debate_state"]
 
         argument = f"Safe Analyst: {response.content}"
 
         new_risk_debate_state = {
-            "history": history + "\n" + argument,
-            "risky_history": risk_debate_state.get("risky_history", ""),
-            "safe_history": safe_history + "\n" + argument,
-            "neutral_history": risk_debate_state.get("neutral_history", ""),
             "latest_speaker": "Safe",
             "current_risky_response": risk_debate_state.get(
                 "current_risky_response", ""
@@ -51,8 +48,24 @@ Engage by questioning their optimism and emphasizing the potential downsides the
                 "current_neutral_response", ""
             ),
             "count": risk_debate_state["count"] + 1,
+            **turn_log,
         }
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return safe_node
+    def safe_node(state) -> dict:
+        response = llm.invoke(build_prompt(state))
+        turn_log = append_turn(
+            state["risk_debate_state"], "Safe", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    async def asafe_node(state) -> dict:
+        prompt = build_prompt(state)
+        response = await llm.ainvoke(prompt)
+        turn_log = await aappend_turn(
+            state["risk_debate_state"], "Safe", response.content, llm
+        )
+        return build_update(state, response, turn_log)
+
+    return RunnableLambda(safe_node, afunc=asafe_node)
@@ -1,10 +1,12 @@
+import asyncio
 import functools
 import time
 import json
+from langchain_core.runnables import RunnableLambda
 
 
 def create_trader(llm, memory):
-    def trader_node(state, name):
+    def build_messages(state):
         company_name = state["company_of_interest"]
         investment_plan = state["investment_plan"]
         market_research_report = state["market_report"]
@@ -13,7 +15,9 @@ def create_trader(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, ticker=state["company_of_interest"]
+        )
 
         past_memory_str = ""
         if past_memories:
@@ -35,12 +39,25 @@ def create_trader(llm, memory):
             context,
         ]
 
-        result = llm.invoke(messages)
+        return messages
 
+    def build_update(result, name):
         return {
             "messages": [result],
             "trader_investment_plan": result.content,
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    def trader_node(state, name):
+        result = llm.invoke(build_messages(state))
+        return build_update(result, name)
+
+    async def atrader_node(state, name):
+        messages = await asyncio.to_thread(build_messages, state)
+        result = await llm.ainvoke(messages)
+        return build_update(result, name)
+
+    return RunnableLambda(
+        functools.partial(trader_node, name="Trader"),
+        afunc=functools.partial(atrader_node, name="Trader"),
+    )
@@ -16,6 +16,10 @@ class InvestDebateState(TypedDict):
         str, "Bearish Conversation history"
     ]  # Bullish Conversation history
     history: Annotated[str, "Conversation history"]  # Conversation history
+    # The three histories above are rendered from turns by the judge; debaters only append turns
+    turns: Annotated[list, "Turn records of the debate, oldest first"]
+    summary: Annotated[str, "Rolling summary of turns compacted out of the prompt window"]
+    summarized_turns: Annotated[int, "Number of leading turns folded into the summary"]
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
@@ -33,6 +37,10 @@ class RiskDebateState(TypedDict):
         str, "Neutral Agent's Conversation history"
     ]  # Conversation history
     history: Annotated[str, "Conversation history"]  # Conversation history
+    # The four histories above are rendered from turns by the judge; debaters only append turns
+    turns: Annotated[list, "Turn records of the debate, oldest first"]
+    summary: Annotated[str, "Rolling summary of turns compacted out of the prompt window"]
+    summarized_turns: Annotated[int, "Number of leading turns folded into the summary"]
     latest_speaker: Annotated[str, "Analyst that spoke last"]
     current_risky_response: Annotated[
         str, "Latest response by the risky analyst"
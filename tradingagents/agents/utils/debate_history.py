@@ -0,0 +1,138 @@
+from typing import Dict, List, Optional
+
+from tradingagents.dataflows.config import get_config
+
+# Defaults for the "debate_history" config section
+DEFAULT_POLICY = {
+    "keep_turns": 6,
+    "summarizer": "truncate",
+    "summary_max_chars": 6000,
+    "turn_summary_chars": 800,
+}
+
+SUMMARY_PROMPT = """You maintain the running summary of a debate between financial analysts. Fold the new turns into the summary so far. Keep every side's key arguments, the figures they cite, and any points conceded or left unanswered. Write at most {max_words} words of plain prose with no preamble.
+
+Summary so far:
+{summary}
+
+New turns:
+{turns}"""
+
+
+def get_policy() -> Dict:
+    """Return the compaction policy from the "debate_history" config section."""
+    return dict(DEFAULT_POLICY, **get_config().get("debate_history", {}))
+
+
+def render_turns(turns: List[Dict], speaker: Optional[str] = None) -> str:
+    """Render turn records as "<Speaker> Analyst: <argument>" lines, optionally for one speaker only."""
+    return "\n".join(
+        f"{turn['speaker']} Analyst: {turn['content']}"
+        for turn in turns
+        if speaker is None or turn["speaker"] == speaker
+    )
+
+
+def render_histories(debate_state, speakers: List[str]) -> Dict[str, str]:
+    """Render the full transcript fields of a finished debate from its turn log.
+
+    Returns "history" plus one "<speaker>_history" entry per speaker, in the
+    same format the debate nodes used to build turn by turn.
+    """
+    turns = debate_state.get("turns", [])
+    histories = {"history": render_turns(turns)}
+    for speaker in speakers:
+        histories[f"{speaker.lower()}_history"] = render_turns(turns, speaker)
+    return histories
+
+
+def prompt_history(debate_state) -> str:
+    """Return the bounded view of the debate used in prompts.
+
+    Turns that were compacted out of the window appear only through the
+    rolling summary; the most recent turns are included verbatim.
+    """
+    turns = debate_state.get("turns", [])
+    recent = render_turns(turns[debate_state.get("summarized_turns", 0):])
+    summary = debate_state.get("summary", "")
+    if not summary:
+        return recent
+    return f"Summary of earlier turns:\n{summary}\n\nMost recent turns:\n{recent}"
+
+
+def _shorten(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    # Prefer ending on a sentence boundary
+    boundary = cut.rfind(". ")
+    if boundary > max_chars // 2:
+        cut = cut[:boundary + 1]
+    return cut + " ..."
+
+
+def _truncate_summary(summary: str, evicted: List[Dict], policy: Dict) -> str:
+    lines = [line for line in summary.split("\n") if line]
+    lines += [
+        f"{turn['speaker']} Analyst: {_shorten(turn['content'], policy['turn_summary_chars'])}"
+        for turn in evicted
+    ]
+    # Drop the oldest lines once the summary exceeds its budget
+    while len(lines) > 1 and sum(len(line) + 1 for line in lines) > policy["summary_max_chars"]:
+        lines.pop(0)
+    return _shorten("\n".join(lines), policy["summary_max_chars"])
+
+
+def _summary_messages(summary: str, evicted: List[Dict], policy: Dict):
+    return [
+        (
+            "human",
+            SUMMARY_PROMPT.format(
+                max_words=policy["summary_max_chars"] // 6,
+                summary=summary or "(none yet)",
+                turns=render_turns(evicted),
+            ),
+        )
+    ]
+
+
+def _with_turn(debate_state, speaker: str, content: str):
+    turns = list(debate_state.get("turns", []))
+    turns.append({"speaker": speaker, "content": content})
+    summarized = debate_state.get("summarized_turns", 0)
+    policy = get_policy()
+    evict_to = max(summarized, len(turns) - policy["keep_turns"])
+    return turns, summarized, evict_to, policy
+
+
+def append_turn(debate_state, speaker: str, content: str, llm=None) -> Dict:
+    """Append a turn to a debate's log and compact turns that left the prompt window.
+
+    Returns the "turns", "summary" and "summarized_turns" fields of the new
+    debate state. With the "llm" summarizer the given model folds evicted
+    turns into the summary; otherwise they are shortened and appended.
+    """
+    turns, summarized, evict_to, policy = _with_turn(debate_state, speaker, content)
+    summary = debate_state.get("summary", "")
+    if evict_to > summarized:
+        evicted = turns[summarized:evict_to]
+        if policy["summarizer"] == "llm" and llm is not None:
+            response = llm.invoke(_summary_messages(summary, evicted, policy))
+            summary = _shorten(response.content, policy["summary_max_chars"])
+        else:
+            summary = _truncate_summary(summary, evicted, policy)
+    return {"turns": turns, "summary": summary, "summarized_turns": evict_to}
+
+
+async def aappend_turn(debate_state, speaker: str, content: str, llm=None) -> Dict:
+    """Async counterpart of append_turn."""
+    turns, summarized, evict_to, policy = _with_turn(debate_state, speaker, content)
+    summary = debate_state.get("summary", "")
+    if evict_to > summarized:
+        evicted = turns[summarized:evict_to]
+        if policy["summarizer"] == "llm" and llm is not None:
+            response = await llm.ainvoke(_summary_messages(summary, evicted, policy))
+            summary = _shorten(response.content, policy["summary_max_chars"])
+        else:
+            summary = _truncate_summary(summary, evicted, policy)
+    return {"turns": turns, "summary": summary, "summarized_turns": evict_to}
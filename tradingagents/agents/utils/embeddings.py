@@ -0,0 +1,156 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from tradingagents.dataflows.tool_cache import SQLiteResultCache
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+class EmbeddingClient:
+    """Embedding service shared by every memory, with batching and caching.
+
+    Texts are content-addressed by a hash of the model name and the text.
+    Vectors already computed are served from an in-process LRU and, if a
+    disk cache path is set, from a SQLite file shared across runs. A text
+    that another thread is already embedding is waited for instead of
+    requested again, and the remaining misses are sent in batches of
+    batch_size.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_CONFIG["embeddings"]["base_url"],
+        model: str = DEFAULT_CONFIG["embeddings"]["model"],
+        batch_size: int = 32,
+        max_cached: int = 4096,
+        disk_path: Optional[str] = None,
+    ):
+        self.base_url = base_url
+        self.model = model
+        self.batch_size = batch_size
+        self.max_cached = max_cached
+        self.disk_cache = SQLiteResultCache(disk_path, max_entries=1000000) if disk_path else None
+        self._client = None
+        self._lock = threading.Lock()
+        self._vectors = OrderedDict()  # key -> vector
+        self._in_flight = {}  # key -> Future of a vector being requested
+        self._stats = {"texts": 0, "hits": 0, "disk_hits": 0, "deduped": 0, "requests": 0, "embedded": 0}
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\0{text}".encode("utf-8")).hexdigest()
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single request to the endpoint."""
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(base_url=self.base_url)
+        response = self._client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one vector per text, in order."""
+        keys = [self._key(text) for text in texts]
+        vectors = {}
+        owned = OrderedDict()  # key -> text this call has to embed
+        waiting = {}  # key -> Future owned by another caller
+
+        with self._lock:
+            self._stats["texts"] += len(texts)
+            for key, text in zip(keys, texts):
+                if key in vectors or key in owned or key in waiting:
+                    self._stats["deduped"] += 1
+                elif key in self._vectors:
+                    self._vectors.move_to_end(key)
+                    vectors[key] = self._vectors[key]
+                    self._stats["hits"] += 1
+                elif key in self._in_flight:
+                    waiting[key] = self._in_flight[key]
+                    self._stats["deduped"] += 1
+                else:
+                    self._in_flight[key] = Future()
+                    owned[key] = text
+
+        try:
+            misses = []
+            for key, text in owned.items():
+                found, vector = self.disk_cache.get(key) if self.disk_cache is not None else (False, None)
+                if found:
+                    self._resolve(key, vector)
+                    vectors[key] = vector
+                    with self._lock:
+                        self._stats["disk_hits"] += 1
+                else:
+                    misses.append(key)
+
+            for start in range(0, len(misses), self.batch_size):
+                batch = misses[start:start + self.batch_size]
+                embedded = self._request([owned[key] for key in batch])
+                with self._lock:
+                    self._stats["requests"] += 1
+                    self._stats["embedded"] += len(batch)
+                for key, vector in zip(batch, embedded):
+                    if self.disk_cache is not None:
+                        self.disk_cache.set(key, vector, method="embedding")
+                    self._resolve(key, vector)
+                    vectors[key] = vector
+        except BaseException as error:
+            # Wake up callers waiting on texts this call did not get to
+            with self._lock:
+                for key in owned:
+                    future = self._in_flight.pop(key, None)
+                    if future is not None:
+                        future.set_exception(error)
+            raise
+
+        for key, future in waiting.items():
+            vectors[key] = future.result()
+        return [vectors[key] for key in keys]
+
+    def embed_one(self, text: str) -> List[float]:
+        return self.embed([text])[0]
+
+    def _resolve(self, key: str, vector: List[float]):
+        with self._lock:
+            self._vectors[key] = vector
+            while len(self._vectors) > self.max_cached:
+                self._vectors.popitem(last=False)
+            future = self._in_flight.pop(key, None)
+        if future is not None:
+            future.set_result(vector)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return text/hit/dedupe/request counters plus the in-process cache size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached"] = len(self._vectors)
+        return stats
+
+
+_clients: Dict[tuple, EmbeddingClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_embedding_client(settings: Optional[Dict[str, Any]] = None) -> EmbeddingClient:
+    """Return the shared EmbeddingClient for an "embeddings" config section.
+
+    Memories and caches configured with the same endpoint, model and cache
+    settings share one client, and with it its cache and in-flight requests.
+    Keys the section leaves out take their DEFAULT_CONFIG values.
+    """
+    settings = dict(DEFAULT_CONFIG["embeddings"], **(settings or {}))
+    key = (
+        settings["base_url"],
+        settings["model"],
+        settings["batch_size"],
+        settings["max_cached"],
+        settings["path"] if settings["disk_cache"] else None,
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = EmbeddingClient(*key)
+            _clients[key] = client
+        return client
@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 
 @tool
@@ -74,4 +74,24 @@ def get_income_statement(
     Returns:
         str: A formatted report containing income statement data
     """
-    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
\ No newline at end of file
+    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+# Native async implementations, used by ToolNode when the graph runs via ainvoke/astream
+async def _aget_fundamentals(ticker, curr_date) -> str:
+    return await aroute_to_vendor("get_fundamentals", ticker, curr_date)
+
+async def _aget_balance_sheet(ticker, freq="quarterly", curr_date=None) -> str:
+    return await aroute_to_vendor("get_balance_sheet", ticker, freq, curr_date)
+
+async def _aget_cashflow(ticker, freq="quarterly", curr_date=None) -> str:
+    return await aroute_to_vendor("get_cashflow", ticker, freq, curr_date)
+
+async def _aget_income_statement(ticker, freq="quarterly", curr_date=None) -> str:
+    return await aroute_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+get_fundamentals.coroutine = _aget_fundamentals
+get_balance_sheet.coroutine = _aget_balance_sheet
+get_cashflow.coroutine = _aget_cashflow
+get_income_statement.coroutine = _aget_income_statement
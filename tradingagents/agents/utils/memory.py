@@ -1,69 +1,103 @@
-import chromadb
-from chromadb.config import Settings
-from openai import OpenAI
+import uuid
+import weakref
+
+from tradingagents.agents.utils.embeddings import get_embedding_client
+from tradingagents.agents.utils.memory_store import DEFAULT_SETTINGS, collection_name, get_memory_store
+
+
+def _delete_collections(store, prefix):
+    store.delete(store.collections(prefix))
 
 
 class FinancialSituationMemory:
-    def __init__(self, name, config):
-        # if config["backend_url"] == "http://localhost:11434/v1":
-            # self.embedding = "nomic-embed-text"
-        # else:
-            # self.embedding = "text-embedding-3-small"
-        # self.embedding = "Qwen/Qwen3-Embedding-4B"
-        self.embedding = "/mnt/raid/models/Qwen3-Embedding-4B"
-        # Embedding 强制使用本地服务
-        self.client = OpenAI(base_url="http://localhost:8000/v1")
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+    def __init__(self, name, config, embedding_client=None, store=None):
+        # Memories share one client per "embeddings" config, and with it cached and in-flight vectors
+        self.embedding_client = embedding_client or get_embedding_client(config.get("embeddings"))
+        settings = dict(DEFAULT_SETTINGS, **(config.get("memory") or {}))
+        self.store = store or get_memory_store(settings)
+        self.name = name
+        self.strategy = settings["strategy"]
+        self.per_ticker = settings["per_ticker"]
+        self._finalizer = None
+        if settings["backend"] == "ephemeral":
+            # In-process memories belong to one graph; other graphs in the process get their own,
+            # and the shared client drops them once the memory is released or garbage collected
+            self.strategy = f"{self.strategy}-{uuid.uuid4().hex[:8]}"
+            self._finalizer = weakref.finalize(
+                self, _delete_collections, self.store, collection_name(self.strategy) + "."
+            )
+        elif settings["warm_load"]:
+            # Load this memory's collections for every ticker now rather than on the first lookup
+            suffix = "." + collection_name(self.name)
+            self.store.warm(
+                [
+                    collection
+                    for collection in self.store.collections(collection_name(self.strategy) + ".")
+                    if collection.endswith(suffix)
+                ]
+            )
+
+    def release(self):
+        """Delete an in-process memory's collections now; persistent memories are kept."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def _collections(self, ticker=None):
+        """Return the collections searched for a ticker, most specific first."""
+        shared = collection_name(self.strategy, self.name)
+        if ticker and self.per_ticker:
+            return [collection_name(self.strategy, ticker, self.name), shared]
+        return [shared]
+
+    def count(self, ticker=None):
+        """Number of stored situations visible to lookups for a ticker"""
+        return sum(self.store.count(collection) for collection in self._collections(ticker))
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        """Get the embedding for a text"""
+        return self.embedding_client.embed_one(text)
+
+    def get_embeddings(self, texts):
+        """Get the embeddings for several texts, batched into as few requests as possible"""
+        return self.embedding_client.embed(texts)
 
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+    def add_situations(self, situations_and_advice, ticker=None):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)
+
+        With per-ticker namespaces, situations added for a ticker are only
+        matched by lookups for that ticker; situations added without one are
+        shared by every ticker.
+        """
 
         situations = []
         advice = []
-        ids = []
-        embeddings = []
-
-        offset = self.situation_collection.count()
 
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
+        for situation, recommendation in situations_and_advice:
             situations.append(situation)
             advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
-
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
-        )
-
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
+
+        if not situations:
+            return
+
+        embeddings = self.get_embeddings(situations)
+        self.store.add(self._collections(ticker)[0], situations, advice, embeddings)
+
+    def get_memories(self, current_situation, n_matches=1, ticker=None):
+        """Find matching recommendations using embeddings"""
         query_embedding = self.get_embedding(current_situation)
 
-        results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
-            include=["metadatas", "documents", "distances"],
-        )
+        matches = []
+        for collection in self._collections(ticker):
+            matches.extend(self.store.query(collection, query_embedding, n_matches))
+        matches.sort(key=lambda match: match[2], reverse=True)
 
         matched_results = []
-        for i in range(len(results["documents"][0])):
+        for situation, recommendation, similarity in matches[:n_matches]:
             matched_results.append(
                 {
-                    "matched_situation": results["documents"][0][i],
-                    "recommendation": results["metadatas"][0][i]["recommendation"],
-                    "similarity_score": 1 - results["distances"][0][i],
+                    "matched_situation": situation,
+                    "recommendation": recommendation,
+                    "similarity_score": similarity,
                 }
             )
 
@@ -72,7 +106,7 @@ class FinancialSituationMemory:
 
 if __name__ == "__main__":
     # Example usage
-    matcher = FinancialSituationMemory()
+    matcher = FinancialSituationMemory("example_memory", {})
 
     # Example data
     example_data = [
@@ -0,0 +1,315 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tradingagents.default_config import DEFAULT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the "memory" config section
+DEFAULT_SETTINGS = {
+    "backend": "ephemeral",
+    "path": None,
+    "index": "flat",
+    "strategy": "default",
+    "per_ticker": False,
+    "warm_load": True,
+}
+
+# (document, recommendation, similarity score)
+Match = Tuple[str, str, float]
+
+
+def collection_name(*parts: str) -> str:
+    """Join namespace parts into a collection name that is valid for every backend."""
+    name = ".".join(re.sub(r"[^A-Za-z0-9_-]+", "_", part) for part in parts if part)
+    # Chroma names are 3-63 characters and must start and end with a letter or digit
+    return name.strip("._-")[:63].rstrip("._-").ljust(3, "0")
+
+
+class MemoryStore(ABC):
+    """Storage of (situation, recommendation, embedding) records in named collections."""
+
+    @abstractmethod
+    def count(self, collection: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, collection: str, documents: List[str], recommendations: List[str], embeddings: List[List[float]]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def query(self, collection: str, embedding: List[float], n_matches: int) -> List[Match]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def collections(self, prefix: str = "") -> List[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, collections: List[str]):
+        """Remove collections and every record in them."""
+        raise NotImplementedError
+
+    def warm(self, collections: List[str]):
+        """Load collections ahead of the first query; a no-op for stores that need no loading."""
+
+
+class ChromaMemoryStore(MemoryStore):
+    """Collections in a chromadb client, in memory or persisted under path.
+
+    Similarity is one minus chroma's default L2 distance, as the memories
+    have always reported it.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        import chromadb
+        from chromadb.config import Settings
+
+        if path:
+            self.client = chromadb.PersistentClient(path=path, settings=Settings(allow_reset=True))
+        else:
+            self.client = chromadb.Client(Settings(allow_reset=True))
+        self._collections = {}
+        self._lock = threading.Lock()
+
+    def _collection(self, name: str):
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                collection = self.client.get_or_create_collection(name=name)
+                self._collections[name] = collection
+            return collection
+
+    def count(self, collection):
+        return self._collection(collection).count()
+
+    def add(self, collection, documents, recommendations, embeddings):
+        self._collection(collection).add(
+            documents=documents,
+            metadatas=[{"recommendation": rec} for rec in recommendations],
+            embeddings=embeddings,
+            # Unique across processes sharing a persistent directory
+            ids=[uuid.uuid4().hex for _ in documents],
+        )
+
+    def query(self, collection, embedding, n_matches):
+        collection = self._collection(collection)
+        n_matches = min(n_matches, collection.count())
+        if n_matches <= 0:
+            return []
+        results = collection.query(
+            query_embeddings=[embedding],
+            n_results=n_matches,
+            include=["metadatas", "documents", "distances"],
+        )
+        return [
+            (document, metadata["recommendation"], 1 - distance)
+            for document, metadata, distance in zip(
+                results["documents"][0], results["metadatas"][0], results["distances"][0]
+            )
+        ]
+
+    def collections(self, prefix=""):
+        names = [getattr(collection, "name", collection) for collection in self.client.list_collections()]
+        return [name for name in names if name.startswith(prefix)]
+
+    def delete(self, collections):
+        existing = set(self.collections())
+        with self._lock:
+            for name in collections:
+                self._collections.pop(name, None)
+                if name in existing:
+                    self.client.delete_collection(name=name)
+
+
+class _LoadedCollection:
+    """In-memory copy of one SQLite collection: its rows, normalized vectors and search index."""
+
+    def __init__(self):
+        self.last_id = 0
+        self.documents = []
+        self.recommendations = []
+        self.vectors = None  # float32 matrix, one normalized row per record
+        self.index = None  # faiss index over vectors when the "hnsw" index is used
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """Collections in one SQLite file, searched in memory by cosine similarity.
+
+    SQLite in WAL mode lets any number of processes read while one writes,
+    so worker processes can share a memory file. Each process keeps the
+    normalized vectors of the collections it uses in memory and picks up
+    rows added by other processes before every query, loading only the new
+    rows. Embeddings are stored with the records and never recomputed.
+
+    index "flat" searches with one NumPy matrix product. "hnsw" also builds
+    a faiss HNSW index for large collections, falling back to flat search
+    when faiss is not installed.
+    """
+
+    def __init__(self, path: str, index: str = "flat"):
+        self.path = path
+        self.index = index
+        if index == "hnsw":
+            try:
+                import faiss  # noqa: F401
+            except ImportError:
+                logger.warning("faiss is not installed; memory search falls back to the flat index")
+                self.index = "flat"
+        elif index != "flat":
+            raise ValueError(f"Unsupported memory index: {index}")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS memories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                collection TEXT NOT NULL,
+                situation TEXT NOT NULL,
+                recommendation TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_memories_collection ON memories (collection, id)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._loaded = {}  # collection -> _LoadedCollection
+
+    def count(self, collection):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM memories WHERE collection = ?", (collection,)
+            ).fetchone()[0]
+
+    def add(self, collection, documents, recommendations, embeddings):
+        now = time.time()
+        rows = [
+            (collection, document, rec, np.asarray(embedding, dtype=np.float32).tobytes(), now)
+            for document, rec, embedding in zip(documents, recommendations, embeddings)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """INSERT INTO memories (collection, situation, recommendation, embedding, created_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                rows,
+            )
+            self._conn.commit()
+
+    def _refresh(self, collection) -> _LoadedCollection:
+        """Bring the in-memory copy of a collection up to date with the file. Call with the lock held."""
+        loaded = self._loaded.setdefault(collection, _LoadedCollection())
+        rows = self._conn.execute(
+            """SELECT id, situation, recommendation, embedding FROM memories
+               WHERE collection = ? AND id > ? ORDER BY id""",
+            (collection, loaded.last_id),
+        ).fetchall()
+        if not rows:
+            return loaded
+
+        vectors = np.stack([np.frombuffer(row[3], dtype=np.float32) for row in rows])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        loaded.last_id = rows[-1][0]
+        loaded.documents.extend(row[1] for row in rows)
+        loaded.recommendations.extend(row[2] for row in rows)
+        loaded.vectors = vectors if loaded.vectors is None else np.vstack([loaded.vectors, vectors])
+        if self.index == "hnsw":
+            import faiss
+
+            if loaded.index is None:
+                loaded.index = faiss.IndexHNSWFlat(vectors.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+            loaded.index.add(vectors)
+        return loaded
+
+    def warm(self, collections):
+        with self._lock:
+            for collection in collections:
+                self._refresh(collection)
+
+    def query(self, collection, embedding, n_matches):
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        with self._lock:
+            loaded = self._refresh(collection)
+            if loaded.vectors is None or n_matches <= 0:
+                return []
+            n_matches = min(n_matches, len(loaded.documents))
+            if loaded.index is not None:
+                scores, positions = loaded.index.search(query[None, :], n_matches)
+                ranked = list(zip(positions[0].tolist(), scores[0].tolist()))
+            else:
+                scores = loaded.vectors @ query
+                positions = np.argsort(-scores)[:n_matches]
+                ranked = [(int(position), float(scores[position])) for position in positions]
+            return [
+                (loaded.documents[position], loaded.recommendations[position], score)
+                for position, score in ranked
+                if position >= 0
+            ]
+
+    def collections(self, prefix=""):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT collection FROM memories WHERE substr(collection, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, collections):
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM memories WHERE collection = ?", [(collection,) for collection in collections]
+            )
+            self._conn.commit()
+            for collection in collections:
+                self._loaded.pop(collection, None)
+
+
+_stores: Dict[tuple, MemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_memory_store(settings: Optional[Dict[str, Any]] = None) -> MemoryStore:
+    """Return the shared MemoryStore for a "memory" config section.
+
+    Graphs configured with the same backend and path share one store, and
+    with it its connection and loaded collections.
+    """
+    settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+    backend = settings["backend"]
+    if settings["path"] is None and backend in ("chroma", "sqlite"):
+        # A partial "memory" section keeps persistent stores in the default directory
+        settings["path"] = DEFAULT_CONFIG["memory"]["path"]
+    key = (backend, settings["path"], settings["index"])
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if backend == "ephemeral":
+                store = ChromaMemoryStore()
+            elif backend == "chroma":
+                store = ChromaMemoryStore(settings["path"])
+            elif backend == "sqlite":
+                path = settings["path"]
+                if not path.endswith((".sqlite", ".db")):
+                    path = os.path.join(path, "memories.sqlite")
+                store = SQLiteMemoryStore(path, settings["index"])
+            else:
+                raise ValueError(f"Unsupported memory backend: {backend}")
+            _stores[key] = store
+        return store
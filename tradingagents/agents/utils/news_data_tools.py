@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 @tool
 def get_news(
@@ -69,3 +69,23 @@ def get_insider_transactions(
         str: A report of insider transaction data
     """
     return route_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+# Native async implementations, used by ToolNode when the graph runs via ainvoke/astream
+async def _aget_news(ticker, start_date, end_date) -> str:
+    return await aroute_to_vendor("get_news", ticker, start_date, end_date)
+
+async def _aget_global_news(curr_date, look_back_days=7, limit=5) -> str:
+    return await aroute_to_vendor("get_global_news", curr_date, look_back_days, limit)
+
+async def _aget_insider_sentiment(ticker, curr_date) -> str:
+    return await aroute_to_vendor("get_insider_sentiment", ticker, curr_date)
+
+async def _aget_insider_transactions(ticker, curr_date) -> str:
+    return await aroute_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+get_news.coroutine = _aget_news
+get_global_news.coroutine = _aget_global_news
+get_insider_sentiment.coroutine = _aget_insider_sentiment
+get_insider_transactions.coroutine = _aget_insider_transactions
@@ -0,0 +1,56 @@
+from typing import List
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from tradingagents.dataflows.config import get_config
+
+# Identical for every debater and round of a run, so it forms a reusable prompt prefix
+SHARED_CONTEXT_PROMPT = """You are one of several analysts at a trading firm debating an investment in {company} as of {trade_date}. Every participant works from the same research, reproduced below. The next message gives your role, the debate so far and what you should say next.
+
+Market research report:
+{market_report}
+
+Social media sentiment report:
+{sentiment_report}
+
+Latest world affairs news:
+{news_report}
+
+Company fundamentals report:
+{fundamentals_report}"""
+
+
+def _cache_control_enabled() -> bool:
+    config = get_config()
+    return (
+        config.get("prompt_caching", {}).get("enabled", True)
+        and config.get("llm_provider", "").lower() == "anthropic"
+    )
+
+
+def shared_context_message(state) -> SystemMessage:
+    """Return the system message holding the analyst reports shared by every debater.
+
+    The text depends only on the run's ticker, date and reports, so providers
+    with automatic prefix caching (OpenAI, vLLM with prefix caching enabled)
+    reuse it across turns. Anthropic only caches marked blocks, so there the
+    block carries a cache_control breakpoint.
+    """
+    text = SHARED_CONTEXT_PROMPT.format(
+        company=state["company_of_interest"],
+        trade_date=state["trade_date"],
+        market_report=state["market_report"],
+        sentiment_report=state["sentiment_report"],
+        news_report=state["news_report"],
+        fundamentals_report=state["fundamentals_report"],
+    )
+    if _cache_control_enabled():
+        return SystemMessage(
+            content=[{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+        )
+    return SystemMessage(content=text)
+
+
+def with_shared_context(state, prompt: str) -> List:
+    """Prefix a node's per-turn prompt with the shared report context."""
+    return [shared_context_message(state), HumanMessage(content=prompt)]
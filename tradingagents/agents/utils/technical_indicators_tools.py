@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 @tool
 def get_indicators(
@@ -20,4 +20,12 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
+    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+# Native async implementations, used by ToolNode when the graph runs via ainvoke/astream
+async def _aget_indicators(symbol, indicator, curr_date, look_back_days=30) -> str:
+    return await aroute_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+get_indicators.coroutine = _aget_indicators
@@ -0,0 +1,16 @@
+# TradingAgents/benchmarks/__init__.py
+
+from .fake_llm import FakeChatModel
+from .fixtures import FixtureEmbeddingClient, FixtureMemory, fixture_config, fixture_vendors
+from .harness import BenchmarkTradingAgentsGraph, format_report, run_benchmark
+
+__all__ = [
+    "FakeChatModel",
+    "FixtureEmbeddingClient",
+    "FixtureMemory",
+    "fixture_config",
+    "fixture_vendors",
+    "BenchmarkTradingAgentsGraph",
+    "format_report",
+    "run_benchmark",
+]
@@ -0,0 +1,134 @@
+# TradingAgents/benchmarks/fake_llm.py
+
+import asyncio
+import itertools
+import random
+import re
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# The analyst prompts state the trade date and ticker in their system message
+DATE_PATTERN = re.compile(r"current date is (\d{4}-\d{2}-\d{2})")
+TICKER_PATTERN = re.compile(
+    r"(?:company we want to look at is|looking at the company|company we want to analyze is) ([A-Za-z0-9.^=\-]+)"
+)
+
+# Words the canned reports are drawn from
+VOCABULARY = (
+    "revenue margin growth guidance valuation momentum support resistance volume "
+    "earnings outlook demand supply pricing competition risk catalyst downside upside "
+    "volatility trend breakout consolidation sentiment analysts institutional retail "
+    "dividend buyback leverage liquidity cash flow multiple premium discount sector"
+).split()
+
+_tool_call_ids = itertools.count(1)
+
+
+class FakeChatModel(BaseChatModel):
+    """Deterministic chat model that scripts the tool calls and reports of a graph run.
+
+    With tools bound and no tool results yet in the conversation, it calls
+    every bound tool once (get_indicators once per entry of indicators).
+    Otherwise it answers with a canned report of about report_words words
+    that ends in a FINAL TRANSACTION PROPOSAL marker, or just the decision
+    when asked to extract one. Responses depend only on the prompt, and
+    latency simulates a provider's response time.
+    """
+
+    report_words: int = 400
+    latency: float = 0.0
+    decision: str = "BUY"
+    indicators: Sequence[str] = ("close_50_sma", "close_10_ema", "macd", "rsi", "boll_ub", "atr")
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages, kwargs.get("tools"))
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages, kwargs.get("tools"))
+
+    def _respond(self, messages: List[BaseMessage], tools: Optional[list]) -> ChatResult:
+        prompt = "\n".join(_text(message) for message in messages)
+        content, tool_calls = "", []
+        if tools and not isinstance(messages[-1], ToolMessage):
+            tool_calls = self._tool_calls(prompt, tools)
+        elif "extract the investment decision" in prompt:
+            content = self.decision
+        else:
+            content = self._report(prompt)
+
+        input_tokens = len(prompt) // 4
+        output_tokens = len(content) // 4 + 10 * len(tool_calls)
+        message = AIMessage(
+            content=content,
+            tool_calls=tool_calls,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _tool_calls(self, prompt: str, tools: list) -> List[dict]:
+        date_match = DATE_PATTERN.search(prompt)
+        ticker_match = TICKER_PATTERN.search(prompt)
+        trade_date = date_match.group(1) if date_match else datetime.today().strftime("%Y-%m-%d")
+        ticker = ticker_match.group(1) if ticker_match else "SPY"
+        start_date = (datetime.strptime(trade_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
+
+        calls = []
+        for tool in tools:
+            function = tool["function"]
+            args = {}
+            for name in function.get("parameters", {}).get("properties", {}):
+                if name in ("symbol", "ticker"):
+                    args[name] = ticker
+                elif name in ("curr_date", "end_date"):
+                    args[name] = trade_date
+                elif name == "start_date":
+                    args[name] = start_date
+            if "indicator" in function.get("parameters", {}).get("properties", {}):
+                variants = [dict(args, indicator=indicator) for indicator in self.indicators]
+            else:
+                variants = [args]
+            for variant in variants:
+                calls.append(
+                    {
+                        "name": function["name"],
+                        "args": variant,
+                        "id": f"call_{next(_tool_call_ids)}",
+                        "type": "tool_call",
+                    }
+                )
+        return calls
+
+    def _report(self, prompt: str) -> str:
+        rng = random.Random(zlib.crc32(prompt.encode("utf-8")))
+        words = [rng.choice(VOCABULARY) for _ in range(self.report_words)]
+        paragraphs = [" ".join(words[i:i + 60]) + "." for i in range(0, len(words), 60)]
+        return "\n\n".join(paragraphs) + f"\n\nFINAL TRANSACTION PROPOSAL: **{self.decision}**"
+
+
+def _text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
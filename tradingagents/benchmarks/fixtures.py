@@ -0,0 +1,350 @@
+# TradingAgents/benchmarks/fixtures.py
+
+import functools
+import random
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Annotated
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from tradingagents.agents.utils.embeddings import EmbeddingClient
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.dataflows.interface import VENDOR_METHODS
+from tradingagents.dataflows.stockstats_utils import get_indicator_frame
+from tradingagents.dataflows.y_finance import BEST_IND_PARAMS, _format_indicator_window
+
+# Vendor name the fixture implementations are registered under
+FIXTURE_VENDOR = "fixture"
+
+# Calendar covered by the synthetic price history
+FIXTURE_START = "2015-01-01"
+FIXTURE_END = "2026-12-31"
+
+# Articles generated per day of a news window
+NEWS_PER_DAY = 3
+
+# Width of the feature-hashed embeddings used by FixtureMemory
+EMBEDDING_DIMENSIONS = 256
+
+HEADLINE_WORDS = (
+    "shares rally slip beat miss guidance raises cuts outlook analysts upgrade downgrade "
+    "record quarter demand chips cloud margins regulators deal expands launches"
+).split()
+
+
+def _rng(*parts) -> random.Random:
+    """Seeded generator, so every fixture is a pure function of its arguments."""
+    return random.Random(zlib.crc32("|".join(str(part) for part in parts).encode("utf-8")))
+
+
+@functools.lru_cache(maxsize=64)
+def fixture_ohlcv(symbol: Annotated[str, "ticker symbol of the company"]) -> pd.DataFrame:
+    """Deterministic daily bars for a symbol, laid out like load_ohlcv's frame."""
+    dates = pd.bdate_range(FIXTURE_START, FIXTURE_END)
+    generator = np.random.default_rng(zlib.crc32(symbol.upper().encode("utf-8")))
+    close = 50 * np.exp(np.cumsum(generator.normal(0.0003, 0.018, len(dates))))
+    open_ = close * (1 + generator.normal(0, 0.005, len(dates)))
+    high = np.maximum(open_, close) * (1 + np.abs(generator.normal(0, 0.008, len(dates))))
+    low = np.minimum(open_, close) * (1 - np.abs(generator.normal(0, 0.008, len(dates))))
+    volume = generator.integers(1_000_000, 50_000_000, len(dates)).astype(np.float64)
+    return pd.DataFrame(
+        {"Date": dates, "Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume}
+    )
+
+
+def get_stock_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    data = fixture_ohlcv(symbol)
+    dates = data["Date"]
+    data = data.iloc[
+        dates.searchsorted(pd.Timestamp(start_date)):dates.searchsorted(pd.Timestamp(end_date))
+    ].set_index("Date")
+    data[["Open", "High", "Low", "Close"]] = data[["Open", "High", "Low", "Close"]].round(2)
+
+    header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
+    header += f"# Total records: {len(data)}\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    return header + data.to_csv()
+
+
+def get_indicators(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+):
+    """Compute the indicator on the fixture history through the shared indicator frame cache."""
+    if indicator not in BEST_IND_PARAMS:
+        raise ValueError(
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+    frame = get_indicator_frame(
+        symbol, FIXTURE_VENDOR, lambda: fixture_ohlcv(symbol).copy(), [indicator]
+    )
+    values = frame[indicator].set_axis(pd.DatetimeIndex(frame["Date"]).normalize())
+
+    return (
+        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + _format_indicator_window(values, before, curr_date_dt)
+        + "\n\n"
+        + BEST_IND_PARAMS[indicator]
+    )
+
+
+def get_fundamentals(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    rng = _rng("fundamentals", ticker, curr_date)
+    fields = {
+        "MarketCapitalization": rng.randint(10, 3000) * 10**9,
+        "PERatio": round(rng.uniform(8, 80), 2),
+        "PEGRatio": round(rng.uniform(0.5, 3), 2),
+        "BookValue": round(rng.uniform(5, 200), 2),
+        "DividendYield": round(rng.uniform(0, 0.04), 4),
+        "EPS": round(rng.uniform(-2, 20), 2),
+        "ProfitMargin": round(rng.uniform(-0.1, 0.5), 4),
+        "OperatingMarginTTM": round(rng.uniform(-0.1, 0.5), 4),
+        "ReturnOnEquityTTM": round(rng.uniform(-0.2, 0.6), 4),
+        "RevenueTTM": rng.randint(1, 500) * 10**9,
+        "QuarterlyRevenueGrowthYOY": round(rng.uniform(-0.3, 0.9), 4),
+        "AnalystTargetPrice": round(rng.uniform(20, 1000), 2),
+        "Beta": round(rng.uniform(0.5, 2.5), 3),
+        "52WeekHigh": round(rng.uniform(50, 1200), 2),
+        "52WeekLow": round(rng.uniform(10, 600), 2),
+    }
+    lines = [f"# Company Fundamentals for {ticker.upper()} as of {curr_date}", ""]
+    lines += [f"{name}: {value}" for name, value in fields.items()]
+    return "\n".join(lines)
+
+
+def _statement(title, rows, ticker, freq, curr_date):
+    periods = 4 if freq.lower() == "quarterly" else 3
+    step = relativedelta(months=3) if freq.lower() == "quarterly" else relativedelta(years=1)
+    end = datetime.strptime(curr_date, "%Y-%m-%d") if curr_date else datetime.now()
+    columns = [(end - step * (i + 1)).strftime("%Y-%m-%d") for i in range(periods)]
+    rng = _rng(title, ticker, freq, curr_date)
+    data = pd.DataFrame(
+        [[float(rng.randint(-5 * 10**9, 50 * 10**9)) for _ in columns] for _ in rows],
+        index=rows,
+        columns=columns,
+    )
+    header = f"# {title} data for {ticker.upper()} ({freq})\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    return header + data.to_csv()
+
+
+BALANCE_SHEET_ROWS = [
+    "Total Assets", "Current Assets", "Cash And Cash Equivalents", "Inventory",
+    "Accounts Receivable", "Total Liabilities", "Current Liabilities", "Long Term Debt",
+    "Stockholders Equity", "Retained Earnings", "Goodwill", "Net PPE",
+]
+CASHFLOW_ROWS = [
+    "Operating Cash Flow", "Capital Expenditure", "Free Cash Flow", "Depreciation And Amortization",
+    "Stock Based Compensation", "Change In Working Capital", "Investing Cash Flow",
+    "Financing Cash Flow", "Repurchase Of Capital Stock", "Cash Dividends Paid",
+]
+INCOME_STATEMENT_ROWS = [
+    "Total Revenue", "Cost Of Revenue", "Gross Profit", "Research And Development",
+    "Selling General And Administration", "Operating Income", "Interest Expense",
+    "Pretax Income", "Tax Provision", "Net Income", "Diluted EPS", "EBITDA",
+]
+
+
+def get_balance_sheet(ticker, freq="quarterly", curr_date=None):
+    return _statement("Balance Sheet", BALANCE_SHEET_ROWS, ticker, freq, curr_date)
+
+
+def get_cashflow(ticker, freq="quarterly", curr_date=None):
+    return _statement("Cash Flow", CASHFLOW_ROWS, ticker, freq, curr_date)
+
+
+def get_income_statement(ticker, freq="quarterly", curr_date=None):
+    return _statement("Income Statement", INCOME_STATEMENT_ROWS, ticker, freq, curr_date)
+
+
+def _articles(rng, subject, days):
+    result = ""
+    for day in days:
+        for _ in range(NEWS_PER_DAY):
+            headline = " ".join(rng.choice(HEADLINE_WORDS) for _ in range(8))
+            summary = " ".join(rng.choice(HEADLINE_WORDS) for _ in range(40))
+            result += f"### {subject} {headline} (source: Fixture Wire, {day})\n{summary}\n\n"
+    return result
+
+
+def get_news(
+    ticker: Annotated[str, "Ticker symbol"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    days = pd.date_range(start_date, end_date, freq="D").strftime("%Y-%m-%d")
+    rng = _rng("news", ticker, start_date, end_date)
+    return f"## {ticker.upper()} News, from {start_date} to {end_date}:\n\n" + _articles(
+        rng, ticker.upper(), days
+    )
+
+
+def get_global_news(curr_date, look_back_days=7, limit=5):
+    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
+    days = pd.date_range(start_date, curr_date, freq="D").strftime("%Y-%m-%d")
+    rng = _rng("global_news", curr_date, look_back_days, limit)
+    articles = _articles(rng, "Markets:", days).split("\n\n")[:limit]
+    return f"## Global News, from {start_date} to {curr_date}:\n\n" + "\n\n".join(articles)
+
+
+def get_insider_sentiment(
+    ticker: Annotated[str, "ticker symbol for the company"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    end = datetime.strptime(curr_date, "%Y-%m-%d")
+    rng = _rng("insider_sentiment", ticker, curr_date)
+    result_str = ""
+    for months_back in range(3, 0, -1):
+        month = end - relativedelta(months=months_back)
+        result_str += (
+            f"### {month.year}-{month.month}:\nChange: {rng.randint(-50000, 50000)}\n"
+            f"Monthly Share Purchase Ratio: {round(rng.uniform(-100, 100), 2)}\n\n"
+        )
+    return (
+        f"## {ticker} Insider Sentiment Data for {(end - relativedelta(days=15)).strftime('%Y-%m-%d')} to {curr_date}:\n"
+        + result_str
+        + "The change field refers to the net buying/selling from all insiders' transactions. The mspr field refers to monthly share purchase ratio."
+    )
+
+
+def get_insider_transactions(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+):
+    end = datetime.strptime(curr_date, "%Y-%m-%d") if curr_date else datetime.now()
+    rng = _rng("insider_transactions", ticker, curr_date)
+    rows = []
+    for i in range(12):
+        rows.append(
+            {
+                "Start Date": (end - relativedelta(days=7 * i + rng.randint(0, 6))).strftime("%Y-%m-%d"),
+                "Insider": f"Insider {rng.randint(1, 20)}",
+                "Position": rng.choice(["Director", "Chief Executive Officer", "Chief Financial Officer", "Officer"]),
+                "Transaction": rng.choice(["Sale", "Purchase", "Stock Gift", "Option Exercise"]),
+                "Shares": rng.randint(100, 200000),
+                "Value": rng.randint(10000, 50000000),
+            }
+        )
+    header = f"# Insider Transactions data for {ticker.upper()}\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    return header + pd.DataFrame(rows).to_csv(index=False)
+
+
+FIXTURE_METHODS = {
+    "get_stock_data": get_stock_data,
+    "get_indicators": get_indicators,
+    "get_fundamentals": get_fundamentals,
+    "get_balance_sheet": get_balance_sheet,
+    "get_cashflow": get_cashflow,
+    "get_income_statement": get_income_statement,
+    "get_news": get_news,
+    "get_global_news": get_global_news,
+    "get_insider_sentiment": get_insider_sentiment,
+    "get_insider_transactions": get_insider_transactions,
+}
+
+
+@contextmanager
+def fixture_vendors():
+    """Route every method of the dataflow interface to its fixture, and only to it.
+
+    Live vendors are removed from the fallback chain while the context is
+    active, so a benchmark never touches the network. Raises if a routed
+    method has no fixture, so a new tool cannot go unbenchmarked.
+    """
+    missing = sorted(set(VENDOR_METHODS) - set(FIXTURE_METHODS))
+    if missing:
+        raise ValueError(f"No fixture implementation for: {missing}")
+
+    originals = dict(VENDOR_METHODS)
+    for method in originals:
+        VENDOR_METHODS[method] = {FIXTURE_VENDOR: FIXTURE_METHODS[method]}
+    try:
+        yield
+    finally:
+        VENDOR_METHODS.update(originals)
+
+
+def fixture_config(config: dict) -> dict:
+    """Return a copy of config that routes every data category to the fixture vendor."""
+    config = dict(config)
+    config["data_vendors"] = {category: FIXTURE_VENDOR for category in config["data_vendors"]}
+    config["tool_vendors"] = {}
+    # Every call should exercise the vendor path, not a result cache from an earlier run
+    config["tool_cache"] = dict(config.get("tool_cache", {}), enabled=False)
+    # Seeded fixture memories must not mix with, or write to, a persistent memory store
+    config["memory"] = dict(config.get("memory", {}), backend="ephemeral")
+    return config
+
+
+# Situations every FixtureMemory starts with, so retrieval returns matches
+SEED_SITUATIONS = [
+    (
+        "High inflation rate with rising interest rates and declining consumer spending",
+        "Consider defensive sectors like consumer staples and utilities. Review fixed-income portfolio duration.",
+    ),
+    (
+        "Tech sector showing high volatility with increasing institutional selling pressure",
+        "Reduce exposure to high-growth tech stocks. Look for value opportunities in established tech companies with strong cash flows.",
+    ),
+    (
+        "Strong dollar affecting emerging markets with increasing forex volatility",
+        "Hedge currency exposure in international positions. Consider reducing allocation to emerging market debt.",
+    ),
+    (
+        "Market showing signs of sector rotation with rising yields",
+        "Rebalance portfolio to maintain target allocations. Consider increasing exposure to sectors benefiting from higher rates.",
+    ),
+]
+
+
+class FixtureEmbeddingClient(EmbeddingClient):
+    """EmbeddingClient that embeds text by feature hashing instead of calling the embedding endpoint.
+
+    Batching, caching and in-flight dedupe are inherited, so benchmarks
+    still exercise them.
+    """
+
+    def __init__(self, dimensions=EMBEDDING_DIMENSIONS):
+        super().__init__(model=f"fixture-hash-{dimensions}")
+        self.dimensions = dimensions
+
+    def _request(self, texts):
+        vectors = []
+        for text in texts:
+            vector = np.zeros(self.dimensions)
+            for token in text.lower().split():
+                vector[zlib.crc32(token.encode("utf-8")) % self.dimensions] += 1.0
+            norm = np.linalg.norm(vector)
+            vectors.append((vector / norm if norm else vector).tolist())
+        return vectors
+
+
+@functools.lru_cache(maxsize=None)
+def _fixture_embedding_client(dimensions):
+    return FixtureEmbeddingClient(dimensions)
+
+
+class FixtureMemory(FinancialSituationMemory):
+    """FinancialSituationMemory backed by a FixtureEmbeddingClient and seeded with SEED_SITUATIONS."""
+
+    def __init__(self, name, config, dimensions=EMBEDDING_DIMENSIONS):
+        super().__init__(name, config, embedding_client=_fixture_embedding_client(dimensions))
+        if self.count() == 0:
+            self.add_situations(SEED_SITUATIONS)
@@ -0,0 +1,224 @@
+# TradingAgents/benchmarks/harness.py
+
+import asyncio
+import copy
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.profiler import summarize_profiles
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+from .fake_llm import FakeChatModel
+from .fixtures import FixtureMemory, fixture_config, fixture_vendors
+
+DEFAULT_TICKERS = ["NVDA", "AAPL", "MSFT", "AMZN"]
+DEFAULT_ANALYSTS = ["market", "social", "news", "fundamentals"]
+
+
+class BenchmarkTradingAgentsGraph(TradingAgentsGraph):
+    """TradingAgentsGraph that uses one scripted chat model for both roles and fixture memories."""
+
+    def __init__(self, llm, selected_analysts=DEFAULT_ANALYSTS, config=None):
+        self._benchmark_llm = llm
+        super().__init__(selected_analysts, debug=False, config=config)
+
+    def _create_llms(self):
+        return self._benchmark_llm, self._benchmark_llm
+
+    def _create_memory(self, name):
+        return FixtureMemory(name, self.config)
+
+
+def run_benchmark(
+    tickers: List[str] = DEFAULT_TICKERS,
+    trade_date: str = "2024-05-10",
+    runs: int = 5,
+    max_concurrency: int = 4,
+    selected_analysts: List[str] = DEFAULT_ANALYSTS,
+    parallel_analysts: bool = False,
+    use_async: bool = False,
+    report_words: int = 400,
+    llm_latency: float = 0.0,
+    config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run TradingAgentsGraph end to end offline and measure the framework's own cost.
+
+    The graph talks to a FakeChatModel and every data tool is served by its
+    fixture, so with llm_latency=0 the measured time is state handling,
+    prompt building, routing and data loading only. A warm-up run is made
+    first so one-off imports and cache fills are reported separately.
+
+    Args:
+        tickers: Tickers cycled through by the single runs and all run once in the batch
+        trade_date: Trade date of every run
+        runs: Number of sequential propagate calls
+        max_concurrency: Concurrency of the batch run
+        selected_analysts: Analysts included in the graph
+        parallel_analysts: Run the analysts as concurrent branches
+        use_async: Run the batch through apropagate_batch instead of propagate_batch
+        report_words: Length of every scripted report
+        llm_latency: Seconds the fake model waits before each response
+        config: Base configuration, DEFAULT_CONFIG if None
+
+    Returns:
+        dict with "settings", "warmup_seconds", "single", "batch", "nodes"
+        (per-node stats from summarize_profiles over the single runs) and
+        "max_rss_bytes".
+    """
+    config = fixture_config(copy.deepcopy(config or DEFAULT_CONFIG))
+    config["parallel_analysts"] = parallel_analysts
+    config["profiling"] = {"enabled": True, "trace_dir": None}
+    llm = FakeChatModel(report_words=report_words, latency=llm_latency)
+
+    previous_dir = os.getcwd()
+    with fixture_vendors(), tempfile.TemporaryDirectory() as workdir:
+        # Full-state logs are written under the working directory
+        os.chdir(workdir)
+        try:
+            graph = BenchmarkTradingAgentsGraph(llm, list(selected_analysts), config)
+
+            started = time.perf_counter()
+            graph.propagate(tickers[0], trade_date)
+            warmup_seconds = time.perf_counter() - started
+
+            single, profiles = _run_single(graph, tickers, trade_date, runs)
+            batch = _run_batch(graph, tickers, trade_date, max_concurrency, use_async)
+        finally:
+            os.chdir(previous_dir)
+
+    return {
+        "settings": {
+            "tickers": list(tickers),
+            "trade_date": trade_date,
+            "runs": runs,
+            "max_concurrency": max_concurrency,
+            "selected_analysts": list(selected_analysts),
+            "parallel_analysts": parallel_analysts,
+            "use_async": use_async,
+            "report_words": report_words,
+            "llm_latency": llm_latency,
+        },
+        "warmup_seconds": warmup_seconds,
+        "single": single,
+        "batch": batch,
+        "nodes": summarize_profiles(profiles)["nodes"],
+        "max_rss_bytes": _max_rss_bytes(),
+    }
+
+
+def _run_single(graph, tickers, trade_date, runs):
+    durations = []
+    profiles = []
+    for i in range(runs):
+        started = time.perf_counter()
+        graph.propagate(tickers[i % len(tickers)], trade_date)
+        durations.append(time.perf_counter() - started)
+        profiles.append(graph.last_profile)
+
+    # Allocation tracing slows Python down, so memory is measured on a separate run
+    tracemalloc.start()
+    try:
+        graph.propagate(tickers[0], trade_date)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = np.asarray(durations)
+    single = {
+        "runs": runs,
+        "mean_seconds": float(seconds.mean()) if runs else None,
+        "p50_seconds": float(np.percentile(seconds, 50)) if runs else None,
+        "p90_seconds": float(np.percentile(seconds, 90)) if runs else None,
+        "runs_per_second": runs / float(seconds.sum()) if runs else None,
+        "peak_traced_bytes": peak_bytes,
+    }
+    return single, profiles
+
+
+def _run_batch(graph, tickers, trade_date, max_concurrency, use_async):
+    def run():
+        if use_async:
+            async def collect():
+                return [
+                    result
+                    async for result in graph.apropagate_batch(
+                        tickers, trade_date, max_concurrency=max_concurrency
+                    )
+                ]
+
+            return asyncio.run(collect())
+        return list(graph.propagate_batch(tickers, trade_date, max_concurrency=max_concurrency))
+
+    started = time.perf_counter()
+    results = run()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        run()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    run_seconds = [
+        result["profile"].wall_time for result in results if result["profile"] is not None
+    ]
+    return {
+        "jobs": len(results),
+        "errors": [repr(result["error"]) for result in results if result["error"] is not None],
+        "elapsed_seconds": elapsed,
+        "runs_per_second": len(results) / elapsed if elapsed else None,
+        "p50_run_seconds": float(np.percentile(run_seconds, 50)) if run_seconds else None,
+        "peak_traced_bytes": peak_bytes,
+    }
+
+
+def _max_rss_bytes():
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a run_benchmark report as plain text."""
+    single, batch = report["single"], report["batch"]
+    lines = [
+        f"Warm-up run: {report['warmup_seconds'] * 1000:.1f} ms",
+        (
+            f"Single: {single['runs']} runs, mean {single['mean_seconds'] * 1000:.1f} ms, "
+            f"p50 {single['p50_seconds'] * 1000:.1f} ms, p90 {single['p90_seconds'] * 1000:.1f} ms, "
+            f"{single['runs_per_second']:.2f} runs/s, peak traced {single['peak_traced_bytes'] / 2**20:.1f} MiB"
+        )
+        if single["runs"]
+        else "Single: no runs",
+        (
+            f"Batch: {batch['jobs']} jobs, {batch['elapsed_seconds'] * 1000:.1f} ms, "
+            f"{batch['runs_per_second']:.2f} runs/s, peak traced {batch['peak_traced_bytes'] / 2**20:.1f} MiB, "
+            f"{len(batch['errors'])} errors"
+        ),
+    ]
+    if report["max_rss_bytes"] is not None:
+        lines.append(f"Max RSS: {report['max_rss_bytes'] / 2**20:.1f} MiB")
+
+    lines.append("")
+    lines.append(f"{'Node':<24}{'calls':>7}{'wall p50 ms':>13}{'wall p90 ms':>13}{'llm ms':>9}{'tool ms':>9}")
+    for node, stats in report["nodes"].items():
+        wall = stats["wall_time"]
+        lines.append(
+            f"{node:<24}{wall['count']:>7}{wall['p50'] * 1000:>13.2f}{wall['p90'] * 1000:>13.2f}"
+            f"{stats['llm_time']['mean'] * 1000:>9.2f}{stats['tool_time']['mean'] * 1000:>9.2f}"
+        )
+    for error in batch["errors"]:
+        lines.append(f"Batch error: {error}")
+    return "\n".join(lines)
@@ -0,0 +1,166 @@
+import json
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = "https://www.alphavantage.co/query"
+
+# Keys of the "alpha_vantage" config section that configure the client itself
+CLIENT_OPTIONS = (
+    "requests_per_minute",
+    "burst",
+    "timeout",
+    "max_retries",
+    "retry_delay",
+    "pool_size",
+)
+
+
+class AlphaVantageRateLimitError(Exception):
+    """Exception raised when Alpha Vantage API rate limit is exceeded."""
+    pass
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class AlphaVantageClient:
+    """Alpha Vantage HTTP client shared by all dataflow modules.
+
+    Requests go through a pooled keep-alive session and a token bucket sized to
+    the plan's requests per minute. Identical requests issued while one is
+    already in flight wait for and share its response. When the API answers
+    with a per-minute rate limit message, all callers are held back and the
+    request is retried after a delay that doubles on each attempt; an
+    AlphaVantageRateLimitError is raised only once the retries are used up or
+    the daily quota is exhausted.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 5,
+        burst: int = 1,
+        timeout: float = 30,
+        max_retries: int = 3,
+        retry_delay: float = 15,
+        pool_size: int = 10,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.limiter = TokenBucket(requests_per_minute, burst)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+    def request(self, params: dict) -> str:
+        """Perform a GET against the query endpoint and return the response text."""
+        key = tuple(sorted((k, str(v)) for k, v in params.items()))
+
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            owner = call is None
+            if owner:
+                call = _InFlight()
+                self._in_flight[key] = call
+
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._request_with_retry(params)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
+
+    def _request_with_retry(self, params: dict) -> str:
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            response = self.session.get(API_BASE_URL, params=params, timeout=self.timeout)
+            response.raise_for_status()
+
+            info_message = _rate_limit_message(response.text)
+            if info_message is None:
+                return response.text
+
+            # A daily quota will not recover within any reasonable retry delay
+            if attempt >= self.max_retries or "per day" in info_message.lower():
+                raise AlphaVantageRateLimitError(
+                    f"Alpha Vantage rate limit exceeded: {info_message}"
+                )
+
+            delay = self.retry_delay * (2 ** attempt)
+            attempt += 1
+            logger.warning(
+                "Alpha Vantage rate limit hit, retrying %s in %.0fs (attempt %d/%d)",
+                params.get("function"), delay, attempt, self.max_retries,
+            )
+            self.limiter.block_for(delay)
+
+
+def _rate_limit_message(response_text: str) -> Optional[str]:
+    """Return the API's rate limit message, or None for a regular response."""
+    # Check if response is JSON (error responses are typically JSON)
+    try:
+        response_json = json.loads(response_text)
+    except json.JSONDecodeError:
+        # Response is not JSON (likely CSV data), which is normal
+        return None
+
+    if isinstance(response_json, dict) and "Information" in response_json:
+        info_message = response_json["Information"]
+        if "rate limit" in info_message.lower() or "api key" in info_message.lower():
+            return info_message
+    return None
+
+
+_client_instance: Optional[AlphaVantageClient] = None
+_client_settings = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> AlphaVantageClient:
+    """Return the shared Alpha Vantage client.
+
+    The client is built lazily from the "alpha_vantage" config section and
+    rebuilt if that section changes.
+    """
+    global _client_instance, _client_settings
+
+    client_config = {
+        key: value
+        for key, value in get_config().get("alpha_vantage", {}).items()
+        if key in CLIENT_OPTIONS
+    }
+    settings = tuple(sorted(client_config.items()))
+    with _client_lock:
+        if _client_instance is None or settings != _client_settings:
+            _client_instance = AlphaVantageClient(**client_config)
+            _client_settings = settings
+        return _client_instance
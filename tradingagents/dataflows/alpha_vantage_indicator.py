@@ -1,4 +1,23 @@
+import logging
+import os
+from io import StringIO
+
+import pandas as pd
+
 from .alpha_vantage_common import _make_api_request
+from .config import get_config
+from .stockstats_utils import get_indicator_frame
+
+logger = logging.getLogger(__name__)
+
+# API keys whose plan does not include TIME_SERIES_DAILY_ADJUSTED; their
+# indicator calls go straight to the indicator endpoints
+_daily_bars_unavailable = set()
+
+
+class DailyBarsUnavailable(Exception):
+    """The daily series endpoint answered with something other than bars, e.g. a premium notice."""
+
 
 def get_indicator(
     symbol: str,
@@ -73,6 +92,34 @@ def get_indicator(
         series_type = required_series_type
 
     try:
+        api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
+        if (
+            get_config().get("alpha_vantage", {}).get("indicator_source", "indicator_api") == "daily_bars"
+            and api_key not in _daily_bars_unavailable
+        ):
+            try:
+                ind_string = _get_indicator_from_daily_bars(
+                    symbol, indicator, curr_date_dt, before, time_period
+                )
+            except DailyBarsUnavailable as e:
+                # TIME_SERIES_DAILY_ADJUSTED is a premium endpoint; don't spend a request on it again
+                _daily_bars_unavailable.add(api_key)
+                logger.warning(
+                    "Alpha Vantage daily bars are not available to this API key (%s); "
+                    "using the indicator endpoints from now on", e
+                )
+            except Exception as e:
+                logger.warning(
+                    "Alpha Vantage daily bars unavailable for %s (%s); using the indicator endpoint", symbol, e
+                )
+            else:
+                return (
+                    f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+                    + ind_string
+                    + "\n\n"
+                    + indicator_descriptions.get(indicator, "No description available.")
+                )
+
         # Get indicator data for the period
         if indicator == "close_50_sma":
             data = _make_api_request("SMA", {
@@ -220,3 +267,57 @@ def get_indicator(
     except Exception as e:
         print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
         return f"Error retrieving {indicator} data: {str(e)}"
+
+
+def _load_daily_bars(symbol: str) -> pd.DataFrame:
+    """Fetch the full adjusted daily history of a symbol in a single request."""
+    data = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", {
+        "symbol": symbol,
+        "outputsize": "full",
+        "datatype": "csv"
+    })
+    df = pd.read_csv(StringIO(data))
+    if "timestamp" not in df.columns or "adjusted_close" not in df.columns:
+        raise DailyBarsUnavailable(f"Unexpected daily series response for {symbol}: {data[:200]}")
+
+    # Back-adjust open/high/low with the same factor as the adjusted close
+    factor = df["adjusted_close"] / df["close"]
+    bars = pd.DataFrame({
+        "Date": pd.to_datetime(df["timestamp"]),
+        "Open": df["open"] * factor,
+        "High": df["high"] * factor,
+        "Low": df["low"] * factor,
+        "Close": df["adjusted_close"],
+        "Volume": df["volume"],
+    })
+    return bars.sort_values("Date").reset_index(drop=True)
+
+
+def _get_indicator_from_daily_bars(symbol, indicator, curr_date_dt, before, time_period) -> str:
+    """
+    Compute an indicator locally from the daily series instead of calling the
+    indicator endpoint. The series is fetched once per symbol and day and shared
+    by every indicator through the stockstats frame cache.
+    """
+    # stockstats column names; RSI and ATR take the requested period
+    column = {
+        "rsi": f"rsi_{time_period}",
+        "atr": f"atr_{time_period}",
+    }.get(indicator, indicator)
+
+    df = get_indicator_frame(
+        symbol, "alpha_vantage", lambda: _load_daily_bars(symbol), [column]
+    )
+    dates = pd.DatetimeIndex(df["Date"])
+    lo = dates.searchsorted(before, side="left")
+    hi = dates.searchsorted(curr_date_dt, side="right")
+    window = pd.Series(df[column].to_numpy()[lo:hi], index=dates[lo:hi]).dropna()
+
+    if window.empty:
+        return "No data available for the specified date range.\n"
+
+    # Same four-decimal precision as the Alpha Vantage indicator endpoints
+    return "".join(
+        f"{date_str}: {value:.4f}\n"
+        for date_str, value in zip(window.index.strftime("%Y-%m-%d"), window.to_numpy())
+    )
@@ -0,0 +1,86 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class CompanyMatcher:
+    """Finds which tickers a piece of text mentions.
+
+    Each ticker's search terms are its company names (alternatives separated by
+    " OR " in the ticker map) plus the ticker itself, matched case-insensitively
+    anywhere in the text. All terms are compiled once: a per-ticker alternation
+    answers "does this text mention TICKER", and one combined pattern tags every
+    mentioned ticker in a single pass over the text.
+    """
+
+    def __init__(self, ticker_to_company: Dict[str, str]):
+        self._patterns = {}
+        term_tickers = {}  # lowercased term -> tickers searching for it
+        for ticker, company in ticker_to_company.items():
+            terms = self.search_terms(ticker, company)
+            self._patterns[ticker] = _compile_alternation(terms)
+            for term in terms:
+                term_tickers.setdefault(term.lower(), set()).add(ticker)
+
+        # At any position the combined pattern reports only the longest term, so
+        # credit every ticker whose term is a prefix of it as well.
+        self._prefix_tickers = {
+            term: set().union(
+                *(tickers for other, tickers in term_tickers.items() if term.startswith(other))
+            )
+            for term in term_tickers
+        }
+        # Zero-width lookahead so that overlapping mentions are all visited
+        self._combined = (
+            re.compile(f"(?=({_alternation(term_tickers)}))", re.IGNORECASE)
+            if term_tickers
+            else None
+        )
+
+    @property
+    def tickers(self):
+        return self._patterns.keys()
+
+    @staticmethod
+    def search_terms(ticker: str, company: str) -> List[str]:
+        return company.split(" OR ") + [ticker]
+
+    def mentions(self, ticker: str, *texts: str) -> bool:
+        """Return True if any of the texts mentions the ticker."""
+        pattern = self._patterns[ticker]
+        return any(pattern.search(text) for text in texts)
+
+    def tag(self, *texts: str) -> Set[str]:
+        """Return every ticker mentioned in any of the texts."""
+        tickers = set()
+        if self._combined is None:
+            return tickers
+        for text in texts:
+            for match in self._combined.finditer(text):
+                tickers |= self._prefix_tickers.get(match.group(1).lower(), set())
+        return tickers
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    # Longest first, so the alternation prefers the longest term at a position
+    return "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+
+
+def _compile_alternation(terms: Iterable[str]):
+    return re.compile(_alternation(terms), re.IGNORECASE)
+
+
+_matcher_instance: Optional[CompanyMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_company_matcher() -> CompanyMatcher:
+    """Return the matcher for the shared ticker_to_company map, compiling it on first use."""
+    global _matcher_instance
+
+    with _matcher_lock:
+        if _matcher_instance is None:
+            from .reddit_utils import ticker_to_company
+
+            _matcher_instance = CompanyMatcher(ticker_to_company)
+        return _matcher_instance
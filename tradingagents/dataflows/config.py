@@ -30,5 +30,20 @@ def get_config() -> Dict:
     return _config.copy()
 
 
+def get_config_section(name: str) -> Dict:
+    """Get a config section, with the keys a partial override leaves out taken from the defaults.
+
+    set_config replaces whole sections, so {"tool_cache": {"enabled": True}}
+    would otherwise drop the default path and limits. Nested settings such
+    as the per-category TTLs are filled in the same way.
+    """
+    section = dict(default_config.DEFAULT_CONFIG.get(name) or {})
+    for key, value in (get_config().get(name) or {}).items():
+        if isinstance(value, dict) and isinstance(section.get(key), dict):
+            value = {**section[key], **value}
+        section[key] = value
+    return section
+
+
 # Initialize with default config
 initialize_config()
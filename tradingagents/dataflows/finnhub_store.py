@@ -0,0 +1,109 @@
+import json
+import mmap
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+# A converted file is a pair next to the original JSON: the UTF-8 encoded
+# entries of every non-empty date back to back, and a sorted index of
+# (date, offset, length) records pointing into it.
+BLOB_SUFFIX = ".bin"
+INDEX_SUFFIX = ".idx.npy"
+
+
+def get_store_paths(json_path: str):
+    """Return the (blob, index) paths of the converted form of a finnhub JSON file."""
+    base, _ = os.path.splitext(json_path)
+    return base + BLOB_SUFFIX, base + INDEX_SUFFIX
+
+
+def convert_finnhub_file(json_path: str) -> int:
+    """Convert one {ticker}_data_formatted.json file. Returns the number of dates stored."""
+    with open(json_path, "r") as f:
+        data = json.load(f)
+
+    dates = sorted(key for key, value in data.items() if len(value) > 0)
+    blob_path, index_path = get_store_paths(json_path)
+
+    width = max((len(date) for date in dates), default=10)
+    index = np.empty(
+        len(dates), dtype=[("date", f"U{width}"), ("offset", "i8"), ("length", "i8")]
+    )
+    offset = 0
+    with open(blob_path + ".tmp", "wb") as f:
+        for i, date in enumerate(dates):
+            encoded = json.dumps(data[date]).encode("utf-8")
+            f.write(encoded)
+            index[i] = (date, offset, len(encoded))
+            offset += len(encoded)
+    np.save(index_path + ".tmp.npy", index)
+
+    os.replace(blob_path + ".tmp", blob_path)
+    os.replace(index_path + ".tmp.npy", index_path)
+    return len(dates)
+
+
+def convert_finnhub_data(data_dir: str) -> int:
+    """Convert every formatted finnhub JSON file under data_dir/finnhub_data. Returns the file count."""
+    converted = 0
+    for root, _, files in os.walk(os.path.join(data_dir, "finnhub_data")):
+        for name in files:
+            if name.endswith("_data_formatted.json"):
+                convert_finnhub_file(os.path.join(root, name))
+                converted += 1
+    return converted
+
+
+class FinnhubStore:
+    """Read-only view of one converted finnhub file.
+
+    Both the index and the entries are memory-mapped, so opening a store is
+    cheap and a range query only decodes the dates it returns.
+    """
+
+    def __init__(self, blob_path: str, index_path: str):
+        self.index = np.load(index_path, mmap_mode="r")
+        self._file = open(blob_path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._blob = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._blob = b""
+
+    def get_range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        """Return {date: entries} for dates between start_date and end_date, inclusive."""
+        dates = self.index["date"]
+        lo = dates.searchsorted(start_date, side="left")
+        hi = dates.searchsorted(end_date, side="right")
+
+        result = {}
+        for date, offset, length in self.index[lo:hi]:
+            result[str(date)] = json.loads(self._blob[offset:offset + length])
+        return result
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def open_finnhub_store(json_path: str) -> Optional[FinnhubStore]:
+    """Return the converted store for a finnhub JSON file.
+
+    Returns None if the file has not been converted, or if the JSON is newer
+    than its conversion, so callers can fall back to reading the JSON.
+    """
+    blob_path, index_path = get_store_paths(json_path)
+    try:
+        converted_at = min(os.path.getmtime(blob_path), os.path.getmtime(index_path))
+    except OSError:
+        return None
+    if os.path.exists(json_path) and os.path.getmtime(json_path) > converted_at:
+        return None
+
+    with _stores_lock:
+        cached = _stores.get(json_path)
+        if cached is None or cached[0] != converted_at:
+            cached = (converted_at, FinnhubStore(blob_path, index_path))
+            _stores[json_path] = cached
+        return cached[1]
@@ -2,6 +2,7 @@ from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from .googlenews_utils import getNewsData
+from .company_matcher import get_company_matcher
 
 
 def get_google_news(
@@ -17,6 +18,14 @@ def get_google_news(
 
     news_results = getNewsData(query, before, curr_date)
 
+    # For a known ticker, list the results that mention the company first; the rest are kept
+    matcher = get_company_matcher()
+    if query.upper() in matcher.tickers:
+        news_results = sorted(
+            news_results,
+            key=lambda news: not matcher.mentions(query.upper(), news["title"], news["snippet"]),
+        )
+
     news_str = ""
 
     for news in news_results:
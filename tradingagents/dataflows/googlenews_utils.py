@@ -1,16 +1,33 @@
-import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
 import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
-import time
-import random
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    retry_if_result,
-)
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# lxml parses result pages several times faster; fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
 
 
 def is_rate_limited(response):
@@ -18,91 +35,190 @@ def is_rate_limited(response):
     return response.status_code == 429
 
 
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
-def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+class GoogleNewsFetcher:
+    """Fetches Google News result pages over a pooled session.
 
-
-def getNewsData(query, start_date, end_date):
+    A query's date range is split into sub-ranges of window_days days that
+    are fetched concurrently on max_workers threads. Within a sub-range the
+    pages are fetched in order, each only once the previous page links to
+    it, so no request of the politeness budget goes to a page past the last
+    one. Every request, from any query, is paced by one token bucket instead
+    of fixed sleeps, and a 429 response holds back every request for an
+    exponentially growing delay, or for the server's Retry-After, before the
+    page is retried.
     """
-    Scrape Google News search results for a given query and date range.
-    query: str - search query
-    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
-    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
-    """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
+    def __init__(
+        self,
+        base_url: str = "https://www.google.com/search",
+        max_workers: int = 4,
+        requests_per_minute: float = 30,
+        burst: int = 4,
+        timeout: float = 15,
+        max_retries: int = 4,
+        retry_delay: float = 4,
+        max_pages: int = 10,
+        window_days: int = 1,
+    ):
+        self.base_url = base_url
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_pages = max_pages
+        self.window_days = max(1, window_days)
+        self.limiter = TokenBucket(requests_per_minute, burst)
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="google-news"
         )
-    }
 
-    news_results = []
-    page = 0
-    while True:
+    def shutdown(self):
+        """Release the fetcher's threads once the fetches already submitted finish."""
+        self._executor.shutdown(wait=False)
+
+    def make_request(self, url):
+        """Make a request, retrying with backoff while rate limited"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            response = self.session.get(url, timeout=self.timeout)
+            if not is_rate_limited(response) or attempt == self.max_retries:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            delay = (
+                float(retry_after)
+                if retry_after.isdigit()
+                else self.retry_delay * (2 ** attempt)
+            )
+            self.limiter.block_for(delay)
+        return response
+
+    def fetch_page(self, query, start_date, end_date, page):
+        """Fetch and parse one result page. Returns (results, has_next_page)."""
         offset = page * 10
         url = (
-            f"https://www.google.com/search?q={query}"
+            f"{self.base_url}?q={query}"
             f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
             f"&tbm=nws&start={offset}"
         )
-
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
+        response = self.make_request(url)
+        soup = BeautifulSoup(response.content, HTML_PARSER)
+
+        news_results = []
+        for el in soup.select("div.SoaBEf"):
+            try:
+                link = el.find("a")["href"]
+                title = el.select_one("div.MBeuO").get_text()
+                snippet = el.select_one(".GI74Re").get_text()
+                date = el.select_one(".LfVVr").get_text()
+                source = el.select_one(".NUnG9d span").get_text()
+                news_results.append(
+                    {
+                        "link": link,
+                        "title": title,
+                        "snippet": snippet,
+                        "date": date,
+                        "source": source,
+                    }
+                )
+            except Exception as e:
+                # If one of the fields is not found, skip this result
+                logger.debug("Skipping Google News result: %s", e)
+                continue
+
+        # Check for the "Next" link (pagination)
+        has_next_page = soup.find("a", id="pnnext") is not None
+        return news_results, has_next_page
+
+    def split_range(self, start_date, end_date) -> List[Tuple[str, str]]:
+        """Split an inclusive mm/dd/yyyy date range into consecutive sub-ranges of window_days days."""
+        start = datetime.strptime(start_date, "%m/%d/%Y")
+        end = datetime.strptime(end_date, "%m/%d/%Y")
+        windows = []
+        while start <= end:
+            window_end = min(start + timedelta(days=self.window_days - 1), end)
+            windows.append((start.strftime("%m/%d/%Y"), window_end.strftime("%m/%d/%Y")))
+            start = window_end + timedelta(days=1)
+        return windows
+
+    def fetch_window(self, query, start_date, end_date):
+        """Fetch every result page for one date range, in page order."""
+        news_results = []
+        for page in range(self.max_pages):
+            try:
+                results_on_page, has_next_page = self.fetch_page(query, start_date, end_date, page)
+            except Exception as e:
+                logger.warning(
+                    "Google News page %d for %s (%s to %s) failed after retries: %s",
+                    page, query, start_date, end_date, e,
+                )
+                break
             if not results_on_page:
                 break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            news_results.extend(results_on_page)
+            if not has_next_page:
                 break
 
-            page += 1
+        return news_results
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
+    def fetch(self, query, start_date, end_date):
+        """Fetch the results for the query, fetching its date sub-ranges concurrently.
+
+        Results come in date order of their sub-range and page order within
+        it. An article listed in more than one sub-range is kept once.
+        """
+        futures = [
+            self._executor.submit(self.fetch_window, query, window_start, window_end)
+            for window_start, window_end in self.split_range(start_date, end_date)
+        ]
+
+        news_results = []
+        seen_links = set()
+        for future in futures:
+            for news in future.result():
+                if news["link"] not in seen_links:
+                    seen_links.add(news["link"])
+                    news_results.append(news)
+        return news_results
+
+
+_fetcher_instance: Optional[GoogleNewsFetcher] = None
+_fetcher_settings = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> GoogleNewsFetcher:
+    """Return the shared fetcher, rebuilt if the "google_news" config section changes."""
+    global _fetcher_instance, _fetcher_settings
+
+    fetcher_config = get_config().get("google_news", {})
+    settings = tuple(sorted(fetcher_config.items()))
+    with _fetcher_lock:
+        if _fetcher_instance is None or settings != _fetcher_settings:
+            if _fetcher_instance is not None:
+                _fetcher_instance.shutdown()
+            _fetcher_instance = GoogleNewsFetcher(**fetcher_config)
+            _fetcher_settings = settings
+        return _fetcher_instance
+
+
+def getNewsData(query, start_date, end_date):
+    """
+    Scrape Google News search results for a given query and date range.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    """
+    if "-" in start_date:
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+        start_date = start_date.strftime("%m/%d/%Y")
+    if "-" in end_date:
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        end_date = end_date.strftime("%m/%d/%Y")
 
-    return news_results
+    return get_fetcher().fetch(query, start_date, end_date)
@@ -1,4 +1,11 @@
-from typing import Annotated
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Annotated, Optional
 
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
@@ -16,10 +23,175 @@ from .alpha_vantage import (
     get_news as get_alpha_vantage_news
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .tool_cache import get_tool_cache, get_ttl, make_cache_key, is_cacheable
+from .vendor_health import get_vendor_health, is_vendor_fault
+from .tracing import get_tracer
+from .rate_limit import report_waits
 
 # Configuration and routing logic
 from .config import get_config
 
+logger = logging.getLogger(__name__)
+
+
+def _result_bytes(result) -> int:
+    return len(result.encode("utf-8")) if isinstance(result, str) else len(str(result).encode("utf-8"))
+
+
+def _call_vendor_impl(method, category, vendor, impl_func, cache, args, kwargs, parent_span=None, clock=None):
+    """Call one vendor implementation through the result cache. Returns (succeeded, result, error).
+
+    Rate-limit waits of the call are added to clock, if given.
+    """
+    with report_waits(clock.add_wait if clock is not None else None), get_tracer().span(
+        "vendor_impl", parent=parent_span, method=method, vendor=vendor, impl=impl_func.__name__
+    ) as span:
+        if cache is not None:
+            cache_key = make_cache_key(method, vendor, impl_func.__name__, args, kwargs)
+            hit, result = cache.get(cache_key)
+            if hit:
+                logger.debug("Cache hit: %s from vendor '%s'", impl_func.__name__, vendor)
+                if span.recording:
+                    span.set(cache="hit", bytes=_result_bytes(result))
+                return True, result, None
+
+        span.set(cache="miss" if cache is not None else "disabled")
+        try:
+            logger.debug("Calling %s from vendor '%s'", impl_func.__name__, vendor)
+            result = impl_func(*args, **kwargs)
+        except AlphaVantageRateLimitError as e:
+            if vendor == "alpha_vantage":
+                logger.warning("Alpha Vantage rate limit exceeded, falling back to next available vendor: %s", e)
+            span.status = "error"
+            span.set(error="rate_limited")
+            return False, None, e
+        except Exception as e:
+            # Log error but continue with other implementations
+            logger.warning("%s from vendor '%s' failed: %s", impl_func.__name__, vendor, e)
+            span.status = "error"
+            span.set(error=repr(e))
+            return False, None, e
+
+        logger.debug("%s from vendor '%s' completed successfully", impl_func.__name__, vendor)
+        if span.recording:
+            span.set(bytes=_result_bytes(result))
+
+        if cache is not None and is_cacheable(result):
+            cache.set(
+                cache_key,
+                result,
+                ttl=get_ttl(category, args, kwargs),
+                method=method,
+                vendor=vendor,
+            )
+        return True, result, None
+
+
+# Vendors and the implementations inside a vendor run on separate pools, so a
+# vendor task waiting on its implementations can never starve them of workers.
+# Async routing calls wait for both on a third pool of their own.
+_vendor_executor = None
+_impl_executor = None
+_async_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_vendor_executor() -> ThreadPoolExecutor:
+    global _vendor_executor
+    with _executor_lock:
+        if _vendor_executor is None:
+            max_workers = get_config().get("vendor_routing", {}).get("max_workers", 16)
+            _vendor_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor")
+        return _vendor_executor
+
+
+def _get_impl_executor() -> ThreadPoolExecutor:
+    global _impl_executor
+    with _executor_lock:
+        if _impl_executor is None:
+            max_workers = get_config().get("vendor_routing", {}).get("max_workers", 16)
+            _impl_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor-impl")
+        return _impl_executor
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    global _async_executor
+    with _executor_lock:
+        if _async_executor is None:
+            max_workers = get_config().get("vendor_routing", {}).get("async_workers", 256)
+            _async_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor-async")
+        return _async_executor
+
+
+class _AbandonedCalls:
+    """Calls a router stopped waiting for (timed out, or lost a hedge) that still hold a pool worker.
+
+    Python threads cannot be cancelled, so an abandoned call keeps its worker
+    until the vendor returns. Once "max_abandoned" calls of a pool are
+    outstanding, routing stops abandoning: it waits for slow vendors past
+    vendor_timeout and does not hedge, so live calls always keep at least
+    max_workers - max_abandoned workers.
+    """
+
+    def __init__(self):
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def add(self, future):
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+
+    def _discard(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def full(self) -> bool:
+        limit = get_config().get("vendor_routing", {}).get("max_abandoned", 8)
+        with self._lock:
+            return len(self._futures) >= limit
+
+
+_abandoned_vendor_calls = _AbandonedCalls()
+_abandoned_impl_calls = _AbandonedCalls()
+
+
+class _AttemptClock:
+    """Running time of one vendor attempt, for its vendor_timeout.
+
+    The clock starts when the attempt starts running, not when it is
+    queued, and time spent waiting for rate-limit tokens is added to the
+    deadline, so neither a busy pool nor a vendor's request budget is
+    mistaken for a slow vendor.
+    """
+
+    def __init__(self):
+        self.started_at = None
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.started_at = time.monotonic()
+
+    def add_wait(self, seconds: float):
+        with self._lock:
+            self.waited += seconds
+
+    def expired(self, timeout, now) -> bool:
+        if timeout is None or self.started_at is None:
+            return False
+        with self._lock:
+            return now >= self.started_at + self.waited + timeout
+
+    def next_check(self, timeout, now) -> Optional[float]:
+        """Earliest time the attempt can expire; rechecked then, as waits push the deadline back."""
+        if timeout is None:
+            return None
+        if self.started_at is None:
+            return now + timeout
+        with self._lock:
+            return self.started_at + self.waited + timeout
+
 # Tools organized by category
 TOOLS_CATEGORIES = {
     "core_stock_apis": {
@@ -140,6 +312,14 @@ def get_vendor(category: str, method: str = None) -> str:
 
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
+    with get_tracer().span("route_to_vendor", method=method) as span:
+        result = _route_to_vendor(span, method, *args, **kwargs)
+        if span.recording:
+            span.set(bytes=_result_bytes(result))
+        return result
+
+
+def _route_to_vendor(span, method: str, *args, **kwargs):
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
@@ -158,87 +338,253 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    logger.debug("%s - Primary: %s | Full fallback order: %s", method, primary_vendors, fallback_vendors)
+    span.set(category=category, primary_vendors=primary_vendors)
 
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
+    cache = get_tool_cache()
+    routing_config = get_config().get("vendor_routing", {})
+    vendor_timeout = routing_config.get("vendor_timeout")
+    hedge_after = routing_config.get("hedge_after")
 
+    supported_vendors = []
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+                logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
             continue
+        supported_vendors.append(vendor)
+
+    # Skip vendors whose circuit is open and put the healthiest fallbacks first
+    health = get_vendor_health()
+    if health is not None:
+        healthy_vendors = health.order(method, supported_vendors, primary_vendors)
+        skipped_vendors = [vendor for vendor in supported_vendors if vendor not in healthy_vendors]
+        if skipped_vendors:
+            logger.info("Circuit open for %s on %s, skipping during cool-down", skipped_vendors, method)
+            span.set(circuit_open=skipped_vendors)
+        supported_vendors = healthy_vendors
+
+    def may_call(vendor):
+        if health is None or health.allow(vendor, method):
+            return True
+        logger.info("Circuit half-open for '%s' on %s and a probe is in flight, skipping", vendor, method)
+        return False
+
+    # An attempt is recorded once: when it is abandoned after vendor_timeout, its late
+    # completion must neither count again nor close a circuit it did not probe
+    recorded_attempts = set()
+    record_lock = threading.Lock()
+
+    def record_attempt(vendor, attempt, succeeded, latency):
+        if health is None:
+            return
+        with record_lock:
+            if attempt in recorded_attempts:
+                return
+            recorded_attempts.add(attempt)
+        health.record(vendor, method, succeeded, latency)
 
+    def run_vendor(vendor, attempt, clock):
+        """Run every implementation of a vendor concurrently and collect the successful results."""
+        clock.start()
         vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
-
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
+        vendor_type = "primary" if vendor in primary_vendors else "fallback"
+        logger.debug("Attempting %s vendor '%s' for %s (attempt #%d)", vendor_type, vendor, method, attempt)
+
+        with get_tracer().span(
+            "vendor", parent=span, method=method, vendor=vendor, attempt=attempt, role=vendor_type
+        ) as vendor_span:
+            started_at = time.monotonic()
+
+            # Handle list of methods for a vendor
+            if isinstance(vendor_impl, list):
+                futures = [
+                    _get_impl_executor().submit(
+                        _call_vendor_impl, method, category, vendor, impl, cache, args, kwargs, vendor_span, clock
+                    )
+                    for impl in vendor_impl
+                ]
+                while True:
+                    if _abandoned_impl_calls.full():
+                        done, not_done = wait(futures)
+                    else:
+                        check_at = clock.next_check(vendor_timeout, time.monotonic())
+                        timeout = None if check_at is None else max(0.0, check_at - time.monotonic())
+                        done, not_done = wait(futures, timeout=timeout)
+                    if not not_done or clock.expired(vendor_timeout, time.monotonic()):
+                        break
+                outcomes = []
+                for impl, future in zip(vendor_impl, futures):
+                    if future in done:
+                        outcomes.append(future.result())
+                    else:
+                        logger.warning("%s from vendor '%s' did not answer within %ss", impl.__name__, vendor, vendor_timeout)
+                        _abandoned_impl_calls.add(future)
+                        outcomes.append((False, None, TimeoutError(f"{impl.__name__} timed out")))
+            else:
+                outcomes = [
+                    _call_vendor_impl(method, category, vendor, vendor_impl, cache, args, kwargs, vendor_span, clock)
+                ]
+
+            vendor_results = [result for ok, result, _ in outcomes if ok]
+            # A vendor that answered with an error about this request (unknown ticker,
+            # missing file) is still up; only transport and server errors count against it
+            healthy = bool(vendor_results) or not any(is_vendor_fault(error) for _, _, error in outcomes)
+            record_attempt(vendor, attempt, healthy, time.monotonic() - started_at - clock.waited)
+            vendor_span.set(results=len(vendor_results))
+            if vendor_results:
+                logger.debug("Vendor '%s' succeeded - Got %d result(s)", vendor, len(vendor_results))
+            else:
+                vendor_span.status = "error"
+                logger.warning("Vendor '%s' produced no results for %s", vendor, method)
+            return vendor_results
+
+    vendor_executor = _get_vendor_executor()
+    vendor_attempt_count = 0
+    timed_out_vendors = []
+
+    if len(primary_vendors) > 1:
+        # Multiple vendor configs (comma-separated) collect from every source, so query them all at once
+        called_vendors = [vendor for vendor in supported_vendors if may_call(vendor)]
+        clocks = [_AttemptClock() for _ in called_vendors]
+        futures = []
+        for vendor, clock in zip(called_vendors, clocks):
+            vendor_attempt_count += 1
+            futures.append(vendor_executor.submit(run_vendor, vendor, vendor_attempt_count, clock))
+
+        # Wait until every vendor has answered or run out of its own time
+        while True:
+            now = time.monotonic()
+            running = [
+                (future, clock)
+                for future, clock in zip(futures, clocks)
+                if not future.done() and not clock.expired(vendor_timeout, now)
+            ]
+            if not running:
                 break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+            if _abandoned_vendor_calls.full():
+                wait(futures)
+                break
+            check_at = [clock.next_check(vendor_timeout, now) for _, clock in running]
+            timeout = None if None in check_at else max(0.0, min(check_at) - now)
+            wait([future for future, _ in running], timeout=timeout, return_when=FIRST_COMPLETED)
+
+        results = []
+        for attempt, (vendor, future) in enumerate(zip(called_vendors, futures), 1):
+            if future.done():
+                results.extend(future.result())
+            else:
+                logger.warning("Vendor '%s' did not answer within %ss", vendor, vendor_timeout)
+                timed_out_vendors.append(vendor)
+                _abandoned_vendor_calls.add(future)
+                record_attempt(vendor, attempt, False, vendor_timeout)
+    else:
+        # Single-vendor config: first vendor with results wins. A vendor that has not answered
+        # within hedge_after seconds gets the next fallback started alongside it.
+        results = []
+        remaining = iter(supported_vendors)
+        pending = {}  # future -> (vendor, attempt, clock)
+        last_launch = None
+
+        def launch_next():
+            nonlocal vendor_attempt_count, last_launch
+            vendor = next(remaining, None)
+            while vendor is not None and not may_call(vendor):
+                vendor = next(remaining, None)
+            if vendor is None:
+                return
+            vendor_attempt_count += 1
+            last_launch = time.monotonic()
+            clock = _AttemptClock()
+            future = vendor_executor.submit(run_vendor, vendor, vendor_attempt_count, clock)
+            pending[future] = (vendor, vendor_attempt_count, clock)
+
+        launch_next()
+        while pending:
+            # With too many abandoned calls still holding workers, wait for the vendors
+            # already running instead of abandoning or hedging them
+            may_abandon = not _abandoned_vendor_calls.full()
+            may_hedge = may_abandon and hedge_after is not None and vendor_attempt_count < len(supported_vendors)
+
+            # Wake up at the earliest vendor deadline or when the hedge budget runs out
+            now = time.monotonic()
+            wake_at = [clock.next_check(vendor_timeout, now) for _, _, clock in pending.values()] if may_abandon else []
+            wake_at = [check_at for check_at in wake_at if check_at is not None]
+            if may_hedge:
+                wake_at.append(last_launch + hedge_after)
+            timeout = max(0.0, min(wake_at) - time.monotonic()) if wake_at else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                vendor, _, _ = pending.pop(future)
+                vendor_results = future.result()
+                if vendor_results:
+                    results = vendor_results
+                    span.set(vendor=vendor)
+                    break
+                launch_next()
+            if results:
+                # Hedged vendors still running lost the race
+                for future in pending:
+                    _abandoned_vendor_calls.add(future)
+                break
+
+            now = time.monotonic()
+            for future, (vendor, attempt, clock) in list(pending.items()):
+                if may_abandon and clock.expired(vendor_timeout, now):
+                    logger.warning("Vendor '%s' did not answer within %ss, falling back to next vendor", vendor, vendor_timeout)
+                    timed_out_vendors.append(vendor)
+                    del pending[future]
+                    _abandoned_vendor_calls.add(future)
+                    record_attempt(vendor, attempt, False, vendor_timeout)
+                    launch_next()
+            if pending and may_hedge and now - last_launch >= hedge_after:
+                logger.info("No answer within %ss, starting next fallback vendor for %s", hedge_after, method)
+                span.set(hedged=True)
+                launch_next()
+
+    span.set(attempts=vendor_attempt_count, results=len(results))
+    if timed_out_vendors:
+        span.set(timed_out=timed_out_vendors)
 
     # Final result summary
     if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        logger.error("All %d vendor attempts failed for method '%s'", vendor_attempt_count, method)
         raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+    logger.debug("Method '%s' completed with %d result(s) from %d vendor attempt(s)", method, len(results), vendor_attempt_count)
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
         return results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results)
+
+
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async counterpart of route_to_vendor.
+
+    The vendor implementations are blocking (yfinance, pandas, requests), so the
+    whole routing call runs on a worker thread and the event loop stays free to
+    drive other graph runs while the tool waits on the vendor. Those threads
+    come from a pool of vendor_routing.async_workers threads rather than the
+    loop's default executor (min(32, cpu + 4) threads), so that many tool
+    calls can be in flight on one loop. Routing calls beyond async_workers
+    queue, and vendor calls themselves still share the max_workers pools.
+    """
+    loop = asyncio.get_running_loop()
+    # Like asyncio.to_thread, run with the caller's context variables
+    call = functools.partial(contextvars.copy_context().run, route_to_vendor, method, *args, **kwargs)
+    return await loop.run_in_executor(_get_async_executor(), call)
+
+
+def get_tool_cache_stats():
+    """Return hit/miss counters of the vendor result cache, or None if it is disabled."""
+    cache = get_tool_cache()
+    return cache.stats() if cache is not None else None
+
+
+def get_vendor_health_stats():
+    """Return circuit breaker state, error rate and latency per vendor and method, or None if disabled."""
+    health = get_vendor_health()
+    return health.stats() if health is not None else None
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+from typing import Annotated
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+# Column layout of the on-disk array. Dates are stored as days since the epoch
+# so that the whole history fits in a single float64 matrix.
+STORE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+HISTORY_YEARS = 15
+
+# Relative tolerance when comparing the overlapping day of an incremental
+# download. Adjusted prices are rewritten after dividends and splits, in which
+# case the stored history no longer lines up and is refetched in full.
+ADJUSTMENT_RTOL = 1e-4
+
+_symbol_locks = {}
+_symbol_locks_guard = threading.Lock()
+
+
+def _get_symbol_lock(symbol: str) -> threading.Lock:
+    with _symbol_locks_guard:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def get_store_paths(symbol: str):
+    """Return the (array, metadata) file paths for a symbol."""
+    store_dir = os.path.join(get_config()["data_cache_dir"], "ohlcv")
+    os.makedirs(store_dir, exist_ok=True)
+    return (
+        os.path.join(store_dir, f"{symbol.upper()}.npy"),
+        os.path.join(store_dir, f"{symbol.upper()}.json"),
+    )
+
+
+def _download(symbol: str, start_date: str, end_date: str) -> np.ndarray:
+    """Download daily bars from Yahoo Finance into the store's array layout."""
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    if data.empty:
+        return np.empty((0, len(STORE_COLUMNS)), dtype=np.float64)
+
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    epoch_days = (
+        data.index.values.astype("datetime64[D]").astype(np.int64).astype(np.float64)
+    )
+    values = data[STORE_COLUMNS[1:]].to_numpy(dtype=np.float64)
+    return np.column_stack([epoch_days, values])
+
+
+def _write(array_path: str, meta_path: str, bars: np.ndarray, meta: dict):
+    tmp_array_path = array_path + ".tmp.npy"
+    np.save(tmp_array_path, bars)
+    os.replace(tmp_array_path, array_path)
+    with open(meta_path + ".tmp", "w") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+
+
+def update_ohlcv(symbol: Annotated[str, "ticker symbol of the company"]):
+    """Bring the stored history for a symbol up to date.
+
+    The first call downloads the full history. Later calls only fetch the days
+    after the last stored bar, re-requesting that last bar to check that the
+    adjustment basis has not changed. At most one download is made per symbol
+    per calendar day. Yahoo Finance answers network and lookup failures with
+    an empty frame, so an empty download never replaces stored bars or counts
+    as the day's fetch; the next call tries again.
+
+    Raises:
+        ValueError: if nothing is stored yet and the download returns no bars
+    """
+    array_path, meta_path = get_store_paths(symbol)
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    with _get_symbol_lock(symbol.upper()):
+        meta = None
+        if os.path.exists(array_path) and os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta["fetched_through"] >= today:
+                return
+
+        if meta is None:
+            start_date = (
+                pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)
+            ).strftime("%Y-%m-%d")
+            bars = _download(symbol, start_date, today)
+            if len(bars) == 0:
+                raise ValueError(f"No price data returned for {symbol} from Yahoo Finance")
+            _write(array_path, meta_path, bars, {"start": start_date, "fetched_through": today})
+            return
+
+        stored = np.load(array_path)
+        if len(stored) == 0:
+            tail_start = meta["start"]
+        else:
+            tail_start = str(np.datetime64(int(stored[-1, 0]), "D"))
+
+        tail = _download(symbol, tail_start, today)
+        if len(tail) == 0:
+            # The request re-covers the last stored bar, so an empty answer is a failed download
+            return
+        if len(stored) and tail[0, 0] == stored[-1, 0]:
+            if not np.allclose(tail[0, 1:5], stored[-1, 1:5], rtol=ADJUSTMENT_RTOL):
+                # Prices were re-adjusted; the stored history is stale
+                bars = _download(symbol, meta["start"], today)
+                if len(bars) == 0:
+                    return
+                _write(array_path, meta_path, bars, {"start": meta["start"], "fetched_through": today})
+                return
+            tail = tail[1:]
+
+        bars = np.concatenate([stored, tail]) if len(tail) else stored
+        _write(array_path, meta_path, bars, {"start": meta["start"], "fetched_through": today})
+
+
+def load_ohlcv(symbol: Annotated[str, "ticker symbol of the company"]) -> pd.DataFrame:
+    """Load the full daily history for a symbol, refreshing the store first.
+
+    The price columns are views onto the memory-mapped array, so no parsing or
+    copying happens on load. Returns a frame with a Date column followed by
+    Open, High, Low, Close and Volume, matching the layout of a reset-index
+    yf.download result.
+    """
+    update_ohlcv(symbol)
+    array_path, _ = get_store_paths(symbol)
+
+    bars = np.load(array_path, mmap_mode="r")
+    data = pd.DataFrame(bars[:, 1:], columns=STORE_COLUMNS[1:], copy=False)
+    data.insert(0, "Date", pd.to_datetime(bars[:, 0].astype(np.int64), unit="D"))
+    return data
@@ -0,0 +1,53 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+_wait_listeners = threading.local()
+
+
+@contextmanager
+def report_waits(listener: Optional[Callable[[float], None]]):
+    """Tell listener how many seconds every TokenBucket wait on this thread will take, before it sleeps."""
+    previous = getattr(_wait_listeners, "listener", None)
+    _wait_listeners.listener = listener
+    try:
+        yield
+    finally:
+        _wait_listeners.listener = previous
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate per minute."""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            listener = getattr(_wait_listeners, "listener", None)
+            if listener is not None:
+                listener(wait)
+            time.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """Hold back every caller for a while, e.g. after the server reported a rate limit."""
+        with self._lock:
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
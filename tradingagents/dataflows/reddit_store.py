@@ -0,0 +1,174 @@
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Annotated, Optional
+
+from .company_matcher import get_company_matcher
+from .reddit_utils import fetch_top_from_category
+
+# Index layout: {data_path}/_index/{category}/manifest.json records the
+# subreddit files that were indexed, and {date}.json holds that UTC day's
+# posts per subreddit (sorted by upvotes) plus a ticker -> post index map.
+INDEX_DIR = "_index"
+
+
+def _get_index_dir(data_path: str, category: str) -> str:
+    return os.path.join(data_path, INDEX_DIR, category)
+
+
+def _file_signature(path: str):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime]
+
+
+def index_reddit_category(data_path: str, category: str) -> int:
+    """Bucket every post of a category by UTC date and subreddit. Returns the number of posts indexed."""
+    category_path = os.path.join(data_path, category)
+    subreddit_files = os.listdir(category_path)
+    track_mentions = "company" in category
+
+    buckets = {}  # date -> subreddit file -> posts
+    indexed = 0
+    for data_file in subreddit_files:
+        if not data_file.endswith(".jsonl"):
+            continue
+        with open(os.path.join(category_path, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                post = {
+                    "title": parsed_line["title"],
+                    "content": parsed_line["selftext"],
+                    "url": parsed_line["url"],
+                    "upvotes": parsed_line["ups"],
+                    "posted_date": post_date,
+                }
+                buckets.setdefault(post_date, {}).setdefault(data_file, []).append(post)
+                indexed += 1
+
+    matcher = get_company_matcher()
+    index_dir = _get_index_dir(data_path, category)
+    os.makedirs(index_dir, exist_ok=True)
+    for post_date, subreddits in buckets.items():
+        mentions = {}
+        for data_file, posts in subreddits.items():
+            posts.sort(key=lambda x: x["upvotes"], reverse=True)
+            if not track_mentions:
+                continue
+            for i, post in enumerate(posts):
+                for ticker in matcher.tag(post["title"], post["content"]):
+                    mentions.setdefault(ticker, {}).setdefault(data_file, []).append(i)
+
+        with open(os.path.join(index_dir, f"{post_date}.json"), "w") as f:
+            json.dump({"posts": subreddits, "mentions": mentions}, f)
+
+    manifest = {
+        "subreddit_files": subreddit_files,
+        "signatures": {
+            data_file: _file_signature(os.path.join(category_path, data_file))
+            for data_file in subreddit_files
+            if data_file.endswith(".jsonl")
+        },
+    }
+    with open(os.path.join(index_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+    return indexed
+
+
+def index_reddit_data(data_path: str) -> int:
+    """Index every category folder under data_path. Returns the number of posts indexed."""
+    return sum(
+        index_reddit_category(data_path, category)
+        for category in os.listdir(data_path)
+        if category != INDEX_DIR and os.path.isdir(os.path.join(data_path, category))
+    )
+
+
+def _load_manifest(data_path: str, category: str) -> Optional[dict]:
+    """Return the category's manifest if its index matches the files on disk."""
+    manifest_path = os.path.join(_get_index_dir(data_path, category), "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    category_path = os.path.join(data_path, category)
+    current_files = os.listdir(category_path)
+    if sorted(current_files) != sorted(manifest["subreddit_files"]):
+        return None
+    for data_file, signature in manifest["signatures"].items():
+        if _file_signature(os.path.join(category_path, data_file)) != signature:
+            return None
+    return manifest
+
+
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """
+    Same result as calling fetch_top_from_category for each day from start_date
+    to end_date and concatenating the posts. Uses the index written by
+    index_reddit_data when it is up to date, reading each day's bucket once;
+    otherwise falls back to scanning the subreddit files day by day.
+    """
+    start_date_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_date_dt = datetime.strptime(end_date, "%Y-%m-%d")
+
+    manifest = _load_manifest(data_path, category)
+    all_content = []
+
+    if manifest is None:
+        curr_date = start_date_dt
+        while curr_date <= end_date_dt:
+            all_content.extend(
+                fetch_top_from_category(
+                    category,
+                    curr_date.strftime("%Y-%m-%d"),
+                    max_limit,
+                    query,
+                    data_path=data_path,
+                )
+            )
+            curr_date += timedelta(days=1)
+        return all_content
+
+    subreddit_files = manifest["subreddit_files"]
+    if max_limit < len(subreddit_files):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
+    limit_per_subreddit = max_limit // len(subreddit_files)
+    filter_by_query = "company" in category and query
+
+    index_dir = _get_index_dir(data_path, category)
+    curr_date = start_date_dt
+    while curr_date <= end_date_dt:
+        bucket_path = os.path.join(index_dir, f"{curr_date.strftime('%Y-%m-%d')}.json")
+        curr_date += timedelta(days=1)
+        if not os.path.exists(bucket_path):
+            continue
+        with open(bucket_path) as f:
+            bucket = json.load(f)
+
+        for data_file in subreddit_files:
+            posts = bucket["posts"].get(data_file, [])
+            if filter_by_query:
+                post_ids = bucket["mentions"].get(query, {}).get(data_file, [])
+                posts = [posts[i] for i in post_ids]
+            all_content.extend(posts[:limit_per_subreddit])
+
+    return all_content
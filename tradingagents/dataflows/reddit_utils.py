@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from contextlib import contextmanager
 from typing import Annotated
 import os
-import re
+from .company_matcher import get_company_matcher
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -98,23 +98,9 @@ def fetch_top_from_category(
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
                 if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
+                    if not get_company_matcher().mentions(
+                        query, parsed_line["title"], parsed_line["selftext"]
+                    ):
                         continue
 
                 post = {
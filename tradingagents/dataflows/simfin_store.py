@@ -0,0 +1,92 @@
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Converted files are pickled next to the original SimFin CSV
+STORE_SUFFIX = ".store.pkl"
+
+
+def get_store_path(csv_path: str) -> str:
+    """Return the path of the converted form of a SimFin CSV file."""
+    base, _ = os.path.splitext(csv_path)
+    return base + STORE_SUFFIX
+
+
+def convert_simfin_file(csv_path: str) -> pd.DataFrame:
+    """Parse a market-wide SimFin CSV once and save it sorted by ticker and publish date."""
+    df = pd.read_csv(csv_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+    # Keep the first report per ticker and publish date, as idxmax would pick it
+    df = df.drop_duplicates(subset=["Ticker", "Publish Date"], keep="first")
+    df = df.sort_values(["Ticker", "Publish Date"], kind="mergesort")
+
+    store_path = get_store_path(csv_path)
+    df.to_pickle(store_path + ".tmp")
+    os.replace(store_path + ".tmp", store_path)
+    return df
+
+
+class SimfinStore:
+    """Ticker-partitioned, publish-date-sorted view of one SimFin statement file."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._partitions = {}
+        tickers = df["Ticker"].to_numpy()
+        # Rows are sorted by ticker, so every ticker is one contiguous block
+        boundaries = np.flatnonzero(tickers[1:] != tickers[:-1]) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(df)]])
+        for start, end in zip(starts, ends):
+            if end > start:
+                block = df.iloc[start:end]
+                self._partitions[tickers[start]] = (
+                    block["Publish Date"].dt.tz_localize(None).to_numpy(),
+                    block,
+                )
+
+    def as_of(self, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """Return the latest statement published on or before curr_date, or None."""
+        partition = self._partitions.get(ticker)
+        if partition is None:
+            return None
+
+        publish_dates, block = partition
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize().tz_localize(None)
+        i = publish_dates.searchsorted(curr_date_dt.to_datetime64(), side="right") - 1
+        if i < 0:
+            return None
+        return block.iloc[i]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def open_simfin_store(csv_path: str) -> SimfinStore:
+    """Return the resident store for a SimFin CSV, converting it on first use.
+
+    The conversion is redone whenever the CSV is newer than its converted file.
+    """
+    store_path = get_store_path(csv_path)
+    csv_mtime = os.path.getmtime(csv_path)
+
+    with _stores_lock:
+        cached = _stores.get(csv_path)
+        if cached is not None and cached[0] >= csv_mtime:
+            return cached[1]
+
+        if os.path.exists(store_path) and os.path.getmtime(store_path) >= csv_mtime:
+            df = pd.read_pickle(store_path)
+        else:
+            df = convert_simfin_file(csv_path)
+
+        store = SimfinStore(df)
+        _stores[csv_path] = (os.path.getmtime(store_path), store)
+        return store
@@ -1,9 +1,141 @@
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, List, Optional
+import os
+
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
-import os
-from .config import get_config, DATA_DIR
+
+from .config import get_config, get_config_section, DATA_DIR
+from .ohlcv_store import load_ohlcv
+
+
+class IndicatorFrameCache:
+    """In-process LRU cache of wrapped stockstats frames.
+
+    Each entry holds the wrapped price history of one symbol and data source as
+    of one day, together with every indicator column computed on it so far, so
+    sibling indicators (macd, macds, macdh) come from the same frame. Entries
+    are evicted in least-recently-used order once the frames exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> {"lock", "frame", "size"}
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_indicators(self, key, load: Callable[[], pd.DataFrame], indicators: List[str]) -> pd.DataFrame:
+        """Return a frame with the Date column and the requested indicator columns.
+
+        load is called to build the raw price frame on a miss. The returned
+        frame is a copy, so callers may modify it freely.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {"lock": threading.Lock(), "frame": None, "size": 0}
+                self._entries[key] = entry
+                self._stats["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+
+        # stockstats adds indicator columns in place, so one thread at a time per frame
+        with entry["lock"]:
+            if entry["frame"] is None:
+                entry["frame"] = wrap(load())
+            result = _select_indicators(entry["frame"], indicators)
+            size = int(entry["frame"].memory_usage(index=True).sum())
+
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._total_bytes += size - entry["size"]
+                entry["size"] = size
+                self._evict()
+        return result
+
+    def stats(self):
+        """Return hit/miss/eviction counters plus the current entry count and size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._total_bytes
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _evict(self):
+        # Never evict the most recently used frame, even if it alone is over budget
+        while (
+            self.max_bytes is not None
+            and self._total_bytes > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            _, old_entry = self._entries.popitem(last=False)
+            self._total_bytes -= old_entry["size"]
+            self._stats["evictions"] += 1
+
+
+def _select_indicators(df, indicators: List[str]) -> pd.DataFrame:
+    # Accessing a column triggers stockstats to calculate that indicator
+    columns = {"Date": df["Date"].to_numpy()}
+    for indicator in indicators:
+        columns[indicator] = df[indicator].to_numpy()
+    return pd.DataFrame(columns)
+
+
+_frame_cache: Optional[IndicatorFrameCache] = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_indicator_frame_cache() -> Optional[IndicatorFrameCache]:
+    """Return the shared indicator frame cache, or None when it is disabled.
+
+    The cache is built lazily from the "indicator_cache" config section and
+    rebuilt if its byte budget changes.
+    """
+    global _frame_cache
+
+    cache_config = get_config_section("indicator_cache")
+    if not cache_config.get("enabled", False):
+        return None
+
+    max_bytes = cache_config.get("max_bytes")
+    with _frame_cache_lock:
+        if _frame_cache is None or _frame_cache.max_bytes != max_bytes:
+            _frame_cache = IndicatorFrameCache(max_bytes)
+        return _frame_cache
+
+
+def get_indicator_frame(
+    symbol: Annotated[str, "ticker symbol for the company"],
+    source: Annotated[str, "identifier of the price data source"],
+    load: Callable[[], pd.DataFrame],
+    indicators: List[str],
+) -> pd.DataFrame:
+    """Compute indicators on a symbol's price history, reusing cached frames.
+
+    Frames are keyed by symbol, data source and today's date, since the
+    online store is refreshed at most once per day.
+    """
+    cache = get_indicator_frame_cache()
+    if cache is None:
+        return _select_indicators(wrap(load()), indicators)
+
+    as_of = pd.Timestamp.today().strftime("%Y-%m-%d")
+    return cache.get_indicators((symbol.upper(), source, as_of), load, indicators)
+
+
+def load_local_price_csv(data_file: str) -> pd.DataFrame:
+    try:
+        return pd.read_csv(data_file)
+    except FileNotFoundError:
+        raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
 
 
 class StockstatsUtils:
@@ -21,58 +153,24 @@ class StockstatsUtils:
         config = get_config()
         online = config["data_vendors"]["technical_indicators"] != "local"
 
-        df = None
-        data = None
-
         if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        DATA_DIR,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            data_file = os.path.join(
+                DATA_DIR,
+                f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+            )
+            df = get_indicator_frame(
+                symbol, data_file, lambda: load_local_price_csv(data_file), [indicator]
+            )
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
             curr_date = pd.to_datetime(curr_date)
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
+            # Full daily history from the per-symbol OHLCV store
+            df = get_indicator_frame(
+                symbol, "online", lambda: load_ohlcv(symbol), [indicator]
             )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
             df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
             curr_date = curr_date.strftime("%Y-%m-%d")
 
-        df[indicator]  # trigger stockstats to calculate the indicator
         matching_rows = df[df["Date"].str.startswith(curr_date)]
 
         if not matching_rows.empty:
@@ -0,0 +1,361 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_config_section
+
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# What vendors return instead of raising when a call failed or found nothing, e.g.
+# "Error retrieving ...", "No data found for symbol ...", "No data available for the specified date range."
+NO_DATA_PATTERN = re.compile(r"^\s*(?:Error\b|No\b.*\bfound\b)|\bNo data available\b")
+
+
+def make_cache_key(method: str, vendor: str, impl_name: str, args, kwargs) -> str:
+    """Content-address a vendor call by hashing its method, vendor and normalized arguments."""
+
+    def normalize(value):
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in sorted(value.items())}
+        return value
+
+    payload = json.dumps(
+        {
+            "method": method,
+            "vendor": vendor,
+            "impl": impl_name,
+            "args": normalize(list(args)),
+            "kwargs": normalize(kwargs),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(result) -> bool:
+    """Skip empty results and the error and no-data strings some vendors return instead of raising.
+
+    A lookup that found nothing may succeed later (data not published yet, a
+    rate limit), so it must not be stored, least of all as an immutable past result.
+    """
+    if result is None:
+        return False
+    if isinstance(result, str):
+        # A report with nothing but its "## ..." headings is empty too
+        body = [line for line in result.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+        return bool(body) and not NO_DATA_PATTERN.search(result)
+    if hasattr(result, "__len__"):
+        return len(result) > 0
+    return True
+
+
+class ResultCache(ABC):
+    """Base class for tool result caches with hit/miss accounting.
+
+    Backends implement _load, _store, _delete, _scan and clear. Entries carry an absolute
+    expiry timestamp (None means the entry never expires) and are evicted in
+    least-recently-used order once max_entries or max_bytes is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cache key."""
+        with self._lock:
+            found, value = self._load(key, time.time())
+            self._stats["hits" if found else "misses"] += 1
+        return found, value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, method: str = "", vendor: str = ""):
+        """Store a value. ttl is in seconds; None keeps the entry until it is evicted."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._store(key, blob, now, expires_at, method, vendor)
+            self._stats["stores"] += 1
+
+    def delete(self, key: str):
+        """Remove an entry if it is present."""
+        with self._lock:
+            self._delete(key)
+
+    def entries(self, method: str, since: float = 0.0) -> List[Tuple[str, Any, float]]:
+        """Return (key, value, created_at) of the live entries stored under method, oldest first.
+
+        Only entries created at or after since are returned, so a caller
+        can pick up what other processes added since its last scan. Scans do
+        not count as hits or refresh an entry's recency.
+        """
+        with self._lock:
+            rows = self._scan(method, since, time.time())
+        return [(key, pickle.loads(blob), created_at) for key, blob, created_at in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/store/eviction counters plus the current entry count."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._count()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    @abstractmethod
+    def clear(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _load(self, key: str, now: float) -> Tuple[bool, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _store(self, key, blob, now, expires_at, method, vendor):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _scan(self, method: str, since: float, now: float) -> List[Tuple[str, bytes, float]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _count(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryResultCache(ResultCache):
+    """In-process LRU cache, useful for a single run or for tests."""
+
+    def __init__(self, max_entries: int = 10000, max_bytes: Optional[int] = None):
+        super().__init__(max_entries, max_bytes)
+        self._entries = OrderedDict()  # key -> (blob, expires_at, method, created_at)
+        self._total_bytes = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _load(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        blob, expires_at = entry[:2]
+        if expires_at is not None and expires_at <= now:
+            self._total_bytes -= len(blob)
+            del self._entries[key]
+            self._stats["expired"] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, pickle.loads(blob)
+
+    def _store(self, key, blob, now, expires_at, method, vendor):
+        self._delete(key)
+        self._entries[key] = (blob, expires_at, method, now)
+        self._total_bytes += len(blob)
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            _, (old_blob, *_) = self._entries.popitem(last=False)
+            self._total_bytes -= len(old_blob)
+            self._stats["evictions"] += 1
+
+    def _delete(self, key):
+        if key in self._entries:
+            self._total_bytes -= len(self._entries.pop(key)[0])
+
+    def _scan(self, method, since, now):
+        rows = [
+            (key, blob, created_at)
+            for key, (blob, expires_at, entry_method, created_at) in self._entries.items()
+            if entry_method == method
+            and created_at >= since
+            and (expires_at is None or expires_at > now)
+        ]
+        return sorted(rows, key=lambda row: row[2])
+
+    def _count(self):
+        return len(self._entries)
+
+
+class SQLiteResultCache(ResultCache):
+    """On-disk cache in a single SQLite file, shared across runs and processes."""
+
+    def __init__(self, path: str, max_entries: int = 10000, max_bytes: Optional[int] = None):
+        super().__init__(max_entries, max_bytes)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS tool_results (
+                key TEXT PRIMARY KEY,
+                method TEXT,
+                vendor TEXT,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tool_results_access ON tool_results (last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tool_results_method ON tool_results (method, created_at)"
+        )
+        self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM tool_results")
+            self._conn.commit()
+
+    def _load(self, key, now):
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        blob, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            self._conn.execute("DELETE FROM tool_results WHERE key = ?", (key,))
+            self._conn.commit()
+            self._stats["expired"] += 1
+            return False, None
+        self._conn.execute(
+            "UPDATE tool_results SET last_access = ? WHERE key = ?", (now, key)
+        )
+        self._conn.commit()
+        return True, pickle.loads(blob)
+
+    def _store(self, key, blob, now, expires_at, method, vendor):
+        self._conn.execute(
+            """INSERT OR REPLACE INTO tool_results
+               (key, method, vendor, value, size, created_at, expires_at, last_access)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (key, method, vendor, blob, len(blob), now, expires_at, now),
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self):
+        count, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tool_results"
+        ).fetchone()
+        excess = max(0, count - self.max_entries)
+        if excess:
+            self._conn.execute(
+                """DELETE FROM tool_results WHERE key IN (
+                    SELECT key FROM tool_results ORDER BY last_access LIMIT ?)""",
+                (excess,),
+            )
+            self._stats["evictions"] += excess
+            total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM tool_results"
+            ).fetchone()[0]
+        if self.max_bytes is not None:
+            while total_bytes > self.max_bytes:
+                row = self._conn.execute(
+                    "SELECT key, size FROM tool_results ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                self._conn.execute("DELETE FROM tool_results WHERE key = ?", (row[0],))
+                total_bytes -= row[1]
+                self._stats["evictions"] += 1
+
+    def _delete(self, key):
+        self._conn.execute("DELETE FROM tool_results WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def _scan(self, method, since, now):
+        return self._conn.execute(
+            """SELECT key, value, created_at FROM tool_results
+               WHERE method = ? AND created_at >= ? AND (expires_at IS NULL OR expires_at > ?)
+               ORDER BY created_at""",
+            (method, since, now),
+        ).fetchall()
+
+    def _count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM tool_results").fetchone()[0]
+
+
+def get_ttl(category: str, args, kwargs) -> Optional[float]:
+    """Return the time-to-live in seconds for a result of the given category.
+
+    Categories listed in "immutable_past" never expire once every date argument
+    of the call lies strictly before today (historical prices, indicators and
+    news windows do not change). Everything else uses the per-category TTL.
+    """
+    cache_config = get_config_section("tool_cache")
+
+    if category in cache_config.get("immutable_past", []):
+        dates = [
+            value
+            for value in list(args) + list(kwargs.values())
+            if isinstance(value, str) and DATE_PATTERN.match(value.strip())
+        ]
+        today = date.today().isoformat()
+        if dates and all(value.strip() < today for value in dates):
+            return None
+
+    return cache_config.get("ttl", {}).get(category)
+
+
+_cache_instance: Optional[ResultCache] = None
+_cache_settings = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> Optional[ResultCache]:
+    """Return the shared tool result cache, or None when caching is disabled.
+
+    The cache is built lazily from the "tool_cache" config section and rebuilt
+    if that section changes.
+    """
+    global _cache_instance, _cache_settings
+
+    cache_config = get_config_section("tool_cache")
+    if not cache_config.get("enabled", False):
+        return None
+
+    settings = (
+        cache_config.get("backend", "sqlite"),
+        cache_config.get("path"),
+        cache_config.get("max_entries", 10000),
+        cache_config.get("max_bytes"),
+    )
+    with _cache_lock:
+        if _cache_instance is None or settings != _cache_settings:
+            backend, path, max_entries, max_bytes = settings
+            if backend == "sqlite":
+                _cache_instance = SQLiteResultCache(path, max_entries, max_bytes)
+            elif backend == "memory":
+                _cache_instance = MemoryResultCache(max_entries, max_bytes)
+            else:
+                raise ValueError(f"Unsupported tool cache backend: {backend}")
+            _cache_settings = settings
+        return _cache_instance
@@ -0,0 +1,188 @@
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from .config import get_config_section
+
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """One timed operation with free-form attributes, exported when it ends."""
+
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.span_id = next(_span_ids)
+        self.trace_id = parent.trace_id if parent is not None and parent.recording else self.span_id
+        self.parent_id = parent.span_id if parent is not None and parent.recording else None
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def end(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+            self._tracer.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.status = "error"
+            self.attributes.setdefault("error", repr(exc))
+        self.end()
+        return False
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled; every operation does nothing."""
+
+    recording = False
+    trace_id = None
+    span_id = None
+
+    def set(self, **attributes):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class InMemoryCollector:
+    """Keeps the most recent finished spans in memory for inspection."""
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self._spans.append(span.to_dict())
+
+    def spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonLinesExporter:
+    """Appends every finished span to a file as one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", buffering=1)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            # Spans still open when the exporter was replaced are dropped
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def span(self, name: str, parent=None, **attributes):
+        """Start a span; use as a context manager or call end() on it."""
+        if self.exporter is None:
+            return NOOP_SPAN
+        return Span(self, name, parent, attributes)
+
+    def export(self, span: Span):
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+
+_tracer_instance = Tracer()
+_tracer_settings = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Return the shared tracer, configured from the "tracing" config section.
+
+    While tracing is disabled the tracer hands out NOOP_SPAN, so instrumented
+    code pays only for a method call.
+    """
+    global _tracer_instance, _tracer_settings
+
+    tracing_config = get_config_section("tracing")
+    settings = (
+        tracing_config.get("enabled", False),
+        tracing_config.get("exporter", "memory"),
+        tracing_config.get("path"),
+        tracing_config.get("max_spans", 10000),
+    )
+    if settings == _tracer_settings:
+        return _tracer_instance
+
+    with _tracer_lock:
+        if settings != _tracer_settings:
+            if isinstance(_tracer_instance.exporter, JsonLinesExporter):
+                _tracer_instance.exporter.close()
+            enabled, exporter, path, max_spans = settings
+            if not enabled:
+                _tracer_instance = Tracer()
+            elif exporter == "memory":
+                _tracer_instance = Tracer(InMemoryCollector(max_spans))
+            elif exporter == "jsonl":
+                _tracer_instance = Tracer(JsonLinesExporter(path))
+            else:
+                raise ValueError(f"Unsupported tracing exporter: {exporter}")
+            _tracer_settings = settings
+        return _tracer_instance
+
+
+def get_collected_spans() -> List[Dict[str, Any]]:
+    """Return the spans held by the in-memory collector, or an empty list."""
+    exporter = get_tracer().exporter
+    return exporter.spans() if isinstance(exporter, InMemoryCollector) else []
@@ -0,0 +1,206 @@
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import openai
+import requests
+
+from .alpha_vantage_client import AlphaVantageRateLimitError
+from .config import get_config_section
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_vendor_fault(error: Optional[BaseException]) -> bool:
+    """Return whether an error means the vendor itself is unavailable.
+
+    Network failures, timeouts, rate limits and server-side errors count
+    against a vendor's circuit. Errors about the request, such as an unknown
+    ticker, a missing local file or a 404, are specific to the call and do not.
+    """
+    if error is None:
+        return False
+    if isinstance(error, (ConnectionError, TimeoutError, AlphaVantageRateLimitError)):
+        return True
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        status = getattr(error.response, "status_code", None)
+        return status is None or status == 429 or status >= 500
+    return isinstance(
+        error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+    )
+
+
+class CircuitBreaker:
+    """Rolling health of one (vendor, method) pair with a circuit breaker.
+
+    The circuit opens after consecutive_failures failures in a row, or once the
+    error rate over the last `window` calls reaches failure_threshold (with at
+    least min_calls recorded). An open circuit rejects calls for `cooldown`
+    seconds, then lets a single probe through: success closes it again, failure
+    re-opens it for another cool-down.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_threshold: float = 0.5,
+        consecutive_failures: int = 5,
+        cooldown: float = 60,
+    ):
+        self.min_calls = min_calls
+        self.failure_threshold = failure_threshold
+        self.consecutive_failures = consecutive_failures
+        self.cooldown = cooldown
+
+        self.state = CLOSED
+        self._calls = deque(maxlen=window)  # (succeeded, latency)
+        self._failure_streak = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+        self._totals = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def error_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for ok, _ in self._calls if not ok) / len(self._calls)
+
+    @property
+    def median_latency(self) -> Optional[float]:
+        latencies = [latency for ok, latency in self._calls if ok]
+        return statistics.median(latencies) if latencies else None
+
+    def is_open(self, now: float) -> bool:
+        """True while calls are rejected, without claiming the half-open probe."""
+        if self.state == OPEN:
+            return now - self._opened_at < self.cooldown
+        return self.state == HALF_OPEN and self._probe_in_flight
+
+    def allow(self, now: float) -> bool:
+        """Return whether a call may go out now; claims the probe of a half-open circuit."""
+        if self.state == OPEN and now - self._opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probe_in_flight):
+            self._totals["rejected"] += 1
+            return False
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = True
+        return True
+
+    def record(self, succeeded: bool, latency: float, now: float):
+        self._calls.append((succeeded, latency))
+        self._totals["calls"] += 1
+        if succeeded:
+            self._failure_streak = 0
+            if self.state == HALF_OPEN:
+                self.state = CLOSED
+                self._calls.clear()
+            return
+
+        self._totals["failures"] += 1
+        self._failure_streak += 1
+        if self.state == HALF_OPEN or self._failure_streak >= self.consecutive_failures or (
+            len(self._calls) >= self.min_calls and self.error_rate >= self.failure_threshold
+        ):
+            if self.state != OPEN:
+                self._totals["opened"] += 1
+            self.state = OPEN
+            self._opened_at = now
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict:
+        stats = dict(self._totals)
+        stats.update(
+            state=self.state,
+            error_rate=self.error_rate,
+            median_latency=self.median_latency,
+            failure_streak=self._failure_streak,
+        )
+        return stats
+
+
+class VendorHealth:
+    """Circuit breakers for every (vendor, method) pair seen by route_to_vendor."""
+
+    def __init__(self, **breaker_options):
+        self._breaker_options = breaker_options
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, vendor: str, method: str) -> CircuitBreaker:
+        key = (vendor, method)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(**self._breaker_options)
+        return breaker
+
+    def order(self, method: str, vendors: List[str], primary_vendors: List[str]) -> List[str]:
+        """Drop vendors whose circuit is open and sort the fallbacks by health.
+
+        Primary vendors keep their configured order. Fallbacks are ordered by
+        rolling error rate, then median latency; vendors without history keep
+        their place among equals.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                vendor for vendor in vendors if not self._breaker(vendor, method).is_open(now)
+            ]
+            primaries = [vendor for vendor in available if vendor in primary_vendors]
+            fallbacks = sorted(
+                (vendor for vendor in available if vendor not in primary_vendors),
+                key=lambda vendor: (
+                    self._breaker(vendor, method).error_rate,
+                    self._breaker(vendor, method).median_latency or 0.0,
+                ),
+            )
+        return primaries + fallbacks
+
+    def allow(self, vendor: str, method: str) -> bool:
+        with self._lock:
+            return self._breaker(vendor, method).allow(time.monotonic())
+
+    def record(self, vendor: str, method: str, succeeded: bool, latency: float):
+        with self._lock:
+            self._breaker(vendor, method).record(succeeded, latency, time.monotonic())
+
+    def stats(self) -> Dict[str, Dict[str, Dict]]:
+        """Return {vendor: {method: breaker stats}}."""
+        with self._lock:
+            stats = {}
+            for (vendor, method), breaker in self._breakers.items():
+                stats.setdefault(vendor, {})[method] = breaker.stats()
+        return stats
+
+
+_health_instance: Optional[VendorHealth] = None
+_health_settings = None
+_health_lock = threading.Lock()
+
+
+def get_vendor_health() -> Optional[VendorHealth]:
+    """Return the shared vendor health tracker, or None when circuit breaking is disabled.
+
+    The tracker is built lazily from the "circuit_breaker" config section and
+    rebuilt (forgetting its history) if that section changes.
+    """
+    global _health_instance, _health_settings
+
+    breaker_config = get_config_section("circuit_breaker")
+    if not breaker_config.pop("enabled", False):
+        return None
+
+    settings = tuple(sorted(breaker_config.items()))
+    with _health_lock:
+        if _health_instance is None or settings != _health_settings:
+            _health_instance = VendorHealth(**breaker_config)
+            _health_settings = settings
+        return _health_instance
@@ -17,6 +17,49 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 90,  # Original is 100. Decrease to 90 because request length > maximum context length
+    # Debate turns kept verbatim in prompts; older turns are folded into a rolling summary
+    "debate_history": {
+        "keep_turns": 6,
+        "summarizer": "truncate",     # Options: truncate (no extra calls), llm (one summary call per evicted turn)
+        "summary_max_chars": 6000,    # Upper bound on the rolling summary
+        "turn_summary_chars": 800,    # Characters kept per turn by the truncate summarizer
+    },
+    # Debaters share a leading system message with the analyst reports; OpenAI and
+    # vLLM (--enable-prefix-caching) reuse it automatically, Anthropic needs a breakpoint
+    "prompt_caching": {
+        "enabled": True,  # Mark the shared block with cache_control when llm_provider is anthropic
+    },
+    # Embedding service shared by the agent memories and the semantic LLM cache
+    "embeddings": {
+        "base_url": "http://localhost:8000/v1",  # Local OpenAI-compatible embedding server
+        "model": "/mnt/raid/models/Qwen3-Embedding-4B",
+        "batch_size": 32,     # Texts per embedding request
+        "max_cached": 4096,   # Vectors kept in the in-process LRU
+        "disk_cache": False,  # Also keep vectors in a SQLite file shared across runs
+        "path": os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/embeddings.sqlite",
+        ),
+    },
+    # Agent memory store; reflections persist across runs with the chroma or sqlite backends
+    "memory": {
+        "backend": "ephemeral",  # Options: ephemeral (in process, per graph), chroma (PersistentClient), sqlite
+        "path": os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/memory",  # Directory; sqlite uses memories.sqlite in it unless given a .sqlite/.db file
+        ),
+        "index": "flat",       # sqlite only. Options: flat (NumPy), hnsw (faiss, falls back to flat)
+        "strategy": "default", # Namespace of every collection; use one per strategy sharing a store
+        "per_ticker": False,   # Keep reflections per ticker, searched together with shared ones
+        "warm_load": True,     # Load stored collections when the graph starts
+    },
+    # Rule-based BUY/SELL/HOLD extraction from the final decision
+    "signal_parser": {
+        "min_confidence": 0.75,  # Below this the quick-thinking LLM extracts the decision
+        "llm_fallback": True,    # If False, low-confidence parses are used as is (HOLD when nothing matched)
+    },
+    # Graph execution settings
+    "parallel_analysts": False,  # Run the selected analysts concurrently, each with its own message list
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -30,4 +73,108 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Vendor call scheduling in route_to_vendor
+    "vendor_routing": {
+        "max_workers": 16,
+        "async_workers": 256,  # Threads for aroute_to_vendor calls, which mostly wait on the vendor pools
+        "vendor_timeout": 120,  # Seconds of running time, not counting queueing or rate-limit waits, before a vendor is abandoned (None = wait indefinitely)
+        "hedge_after": None,    # Seconds before also starting the next fallback vendor (None = no hedging)
+        # Abandoned calls keep their worker until the vendor returns; at this many per pool,
+        # slow vendors are waited for past vendor_timeout and hedging pauses
+        "max_abandoned": 8,
+    },
+    # Per-vendor, per-method circuit breaker used by route_to_vendor. Only transport,
+    # rate-limit and server errors count; errors about one request (unknown ticker) do not
+    "circuit_breaker": {
+        "enabled": True,
+        "window": 20,                # Calls in the rolling error-rate window
+        "min_calls": 5,              # Calls needed before the error rate can open the circuit
+        "failure_threshold": 0.5,    # Error rate that opens the circuit
+        "consecutive_failures": 5,   # Failures in a row that open the circuit
+        "cooldown": 60,              # Seconds a circuit stays open before a probe call
+    },
+    # Span tracing of tool routing; exporter is "memory" (see get_collected_spans) or "jsonl"
+    "tracing": {
+        "enabled": False,
+        "exporter": "memory",
+        "path": os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/traces.jsonl",
+        ),
+        "max_spans": 10000,
+    },
+    # Per-node wall time, LLM latency, token and tool-time profiling of graph runs
+    "profiling": {
+        "enabled": False,
+        "trace_dir": None,  # Directory for per-run Chrome trace files (None = keep profiles in memory only)
+    },
+    # Vendor result cache, keyed on (method, vendor, normalized args)
+    "tool_cache": {
+        "enabled": False,
+        "backend": "sqlite",  # Options: sqlite, memory
+        "path": os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/tool_cache.sqlite",
+        ),
+        "max_entries": 20000,
+        "max_bytes": 512 * 1024 * 1024,
+        # Seconds before a cached result expires (None = never)
+        "ttl": {
+            "core_stock_apis": 60 * 60,
+            "technical_indicators": 60 * 60,
+            "fundamental_data": 7 * 24 * 60 * 60,
+            "news_data": 60 * 60,
+        },
+        # Categories whose results never expire once every date argument is in the past
+        "immutable_past": ["core_stock_apis", "technical_indicators", "news_data"],
+    },
+    # Chat model response cache, keyed on (model, messages, bound tools, call parameters).
+    # Responses are replayed verbatim, so only enable it for reproducible reruns.
+    "llm_cache": {
+        "enabled": False,
+        "backend": "sqlite",  # Options: sqlite, memory
+        "path": os.path.join(
+            os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
+            "dataflows/data_cache/llm_cache.sqlite",
+        ),
+        "max_entries": 50000,
+        "max_bytes": 1024 * 1024 * 1024,
+        # Fall back to the most similar earlier prompt with the same dates and symbols,
+        # embedded with the "embeddings" service
+        "semantic": {
+            "enabled": False,
+            "threshold": 0.97,       # Minimum cosine similarity
+            "max_candidates": 256,   # Prompts indexed per model/tool/parameter combination
+            "max_chars": 16000,      # Trailing prompt characters embedded
+        },
+    },
+    # Alpha Vantage client settings; match requests_per_minute to your plan
+    "alpha_vantage": {
+        "requests_per_minute": 5,
+        "burst": 1,
+        "timeout": 30,
+        "max_retries": 3,
+        "retry_delay": 15,  # Seconds before retrying a rate-limited call, doubled per attempt
+        "pool_size": 10,
+        # "indicator_api": one indicator endpoint request per indicator
+        # "daily_bars": compute indicators locally from one daily series fetch per symbol;
+        # needs a premium key, falls back to the indicator endpoints when the fetch fails
+        "indicator_source": "indicator_api",
+    },
+    # Google News scraping: concurrent fetches of date sub-ranges under a politeness budget
+    "google_news": {
+        "max_workers": 4,   # Sub-ranges fetched at once; the pages of one sub-range are fetched in order
+        "window_days": 1,   # Days per sub-range
+        "requests_per_minute": 30,
+        "burst": 4,
+        "timeout": 15,
+        "max_retries": 4,
+        "retry_delay": 4,  # Seconds before retrying a 429, doubled per attempt
+        "max_pages": 10,
+    },
+    # In-process cache of stockstats frames shared by indicator calls
+    "indicator_cache": {
+        "enabled": True,
+        "max_bytes": 256 * 1024 * 1024,
+    },
 }
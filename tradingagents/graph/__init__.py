@@ -5,7 +5,9 @@ from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
-from .signal_processing import SignalProcessor
+from .signal_processing import SignalProcessor, parse_signal
+from .profiler import NodeProfiler, RunProfile, summarize_profiles
+from .llm_cache import LLMResponseCache, get_llm_response_cache
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +16,10 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "parse_signal",
+    "NodeProfiler",
+    "RunProfile",
+    "summarize_profiles",
+    "LLMResponseCache",
+    "get_llm_response_cache",
 ]
@@ -0,0 +1,285 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from langchain_core.caches import BaseCache
+
+from tradingagents.agents.utils.embeddings import get_embedding_client
+from tradingagents.dataflows.config import get_config_section
+from tradingagents.dataflows.tool_cache import MemoryResultCache, ResultCache, SQLiteResultCache
+
+logger = logging.getLogger(__name__)
+
+# Dates and upper-case symbols (tickers, signals) must match exactly before a
+# near-duplicate answer is reused; prompts for another ticker or day embed very closely
+ANCHOR_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2}\b|\b[A-Z][A-Z0-9]{1,9}(?:\.[A-Z]{1,2})?\b")
+
+
+# Per-response bookkeeping on earlier AI messages; a replayed message differs from the
+# original here (LangChain adds a zero total_cost on cache hits) but not in content
+VOLATILE_MESSAGE_FIELDS = ("id", "usage_metadata", "response_metadata")
+
+
+def _normalize_prompt(prompt: str) -> str:
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+    for message in messages:
+        kwargs = message.get("kwargs") if isinstance(message, dict) else None
+        if isinstance(kwargs, dict):
+            for field in VOLATILE_MESSAGE_FIELDS:
+                kwargs.pop(field, None)
+    return json.dumps(messages, sort_keys=True)
+
+
+def make_llm_cache_key(prompt: str, llm_string: str) -> str:
+    """Content-address a model call by its serialized messages and model/tool/parameter string."""
+    digest = hashlib.sha256(llm_string.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(_normalize_prompt(prompt).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _prompt_text(prompt: str) -> str:
+    """Return the plain text of the serialized messages LangChain passes as the prompt."""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    parts = []
+    for message in messages if isinstance(messages, list) else [messages]:
+        kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+        content = kwargs.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(
+                part.get("text", "") if isinstance(part, dict) else str(part) for part in content
+            )
+        parts.append(f"{kwargs.get('type', '')}: {content}")
+    return "\n".join(parts)
+
+
+class SemanticIndex:
+    """Embedding-similarity lookup of cached prompts, one index per model/tool/parameter string.
+
+    Each index maps exact cache keys to the normalized embedding of their
+    prompt and the dates and symbols it mentions. Every candidate is one
+    entry of the result cache, filed under the index key, so an add writes
+    one small row, survives restarts and never overwrites candidates added
+    by other processes; lookups pick up those rows as they appear. A lookup
+    returns the exact key of the most similar earlier prompt with identical
+    anchors, if the cosine similarity reaches threshold.
+    """
+
+    def __init__(
+        self,
+        store: ResultCache,
+        embed: Callable[[str], List[float]],
+        threshold: float = 0.97,
+        max_candidates: int = 256,
+        max_chars: int = 16000,
+    ):
+        self.store = store
+        self.embed = embed
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._indexes = {}  # index key -> {exact key: (anchors, vector)}, oldest first
+        self._scanned_at = {}  # index key -> created_at of the newest candidate row loaded
+        # A miss embeds the prompt in lookup and again in add once the model has answered
+        self._recent_vectors = OrderedDict()
+
+    def _index_key(self, llm_string: str) -> str:
+        return "semantic-index:" + hashlib.sha256(llm_string.encode("utf-8")).hexdigest()
+
+    def _index(self, index_key: str) -> Dict[str, Any]:
+        """Return an index with the candidates stored since the last call loaded. Call with the lock held."""
+        index = self._indexes.setdefault(index_key, {})
+        scanned_at = self._scanned_at.get(index_key, 0.0)
+        for _, (key, anchors, vector), created_at in self.store.entries(index_key, scanned_at):
+            index.pop(key, None)
+            index[key] = (anchors, vector)
+            scanned_at = max(scanned_at, created_at)
+        self._scanned_at[index_key] = scanned_at
+        self._trim(index_key, index)
+        return index
+
+    def _trim(self, index_key: str, index: Dict[str, Any]):
+        # Dicts keep insertion order, so the oldest prompts go first
+        while len(index) > self.max_candidates:
+            key = next(iter(index))
+            del index[key]
+            self.store.delete(f"{index_key}:{key}")
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+            self._scanned_at.clear()
+
+    def _vector(self, text: str):
+        # Prompts that differ only in their latest turn share long prefixes, so the tail is embedded
+        text = text[-self.max_chars:]
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            vector = self._recent_vectors.get(digest)
+        if vector is not None:
+            return vector
+
+        vector = np.asarray(self.embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        with self._lock:
+            self._recent_vectors[digest] = vector
+            if len(self._recent_vectors) > 64:
+                self._recent_vectors.popitem(last=False)
+        return vector
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[str]:
+        text = _prompt_text(prompt)
+        anchors = tuple(sorted(set(ANCHOR_PATTERN.findall(text))))
+        index_key = self._index_key(llm_string)
+        with self._lock:
+            candidates = [
+                (key, vector)
+                for key, (key_anchors, vector) in self._index(index_key).items()
+                if key_anchors == anchors
+            ]
+        if not candidates:
+            return None
+
+        query = self._vector(text)
+        keys = [key for key, _ in candidates]
+        scores = np.stack([vector for _, vector in candidates]) @ query
+        best = int(np.argmax(scores))
+        return keys[best] if scores[best] >= self.threshold else None
+
+    def add(self, prompt: str, llm_string: str, key: str):
+        text = _prompt_text(prompt)
+        anchors = tuple(sorted(set(ANCHOR_PATTERN.findall(text))))
+        vector = self._vector(text)
+        index_key = self._index_key(llm_string)
+        with self._lock:
+            index = self._index(index_key)
+            index.pop(key, None)
+            index[key] = (anchors, vector)
+            self.store.set(f"{index_key}:{key}", (key, anchors, vector), method=index_key)
+            self._trim(index_key, index)
+
+
+class LLMResponseCache(BaseCache):
+    """LangChain cache for chat model responses, backed by a tool-cache style ResultCache.
+
+    Set as a chat model's cache, it is consulted by LangChain before every
+    call with the serialized messages and a string describing the model,
+    bound tools and call parameters, so an exact repeat of a call returns the
+    stored generations instead of reaching the provider. With a semantic
+    index, a miss falls back to the most similar earlier prompt for the same
+    model string.
+    """
+
+    def __init__(self, store: ResultCache, semantic: Optional[SemanticIndex] = None):
+        self.store = store
+        self.semantic = semantic
+        self._semantic_hits = 0
+
+    def lookup(self, prompt: str, llm_string: str):
+        key = make_llm_cache_key(prompt, llm_string)
+        found, generations = self.store.get(key)
+        if found:
+            return generations
+        if self.semantic is None:
+            return None
+
+        # The semantic tier is optional; an unreachable embedding service is a miss, not a failed call
+        try:
+            similar_key = self.semantic.lookup(prompt, llm_string)
+        except Exception as e:
+            logger.warning("Semantic LLM cache lookup failed, treating it as a miss: %s", e)
+            return None
+        if similar_key is None:
+            return None
+        found, generations = self.store.get(similar_key)
+        if not found:
+            return None
+        self._semantic_hits += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val):
+        key = make_llm_cache_key(prompt, llm_string)
+        self.store.set(key, return_val, method="llm")
+        if self.semantic is not None:
+            try:
+                self.semantic.add(prompt, llm_string, key)
+            except Exception as e:
+                logger.warning("Could not add the prompt to the semantic LLM cache: %s", e)
+
+    def clear(self, **kwargs):
+        self.store.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the store's counters plus hits served by the semantic tier."""
+        stats = self.store.stats()
+        stats["semantic_hits"] = self._semantic_hits
+        return stats
+
+
+_cache_instance: Optional[LLMResponseCache] = None
+_cache_settings = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Return the shared LLM response cache, or None when it is disabled.
+
+    The cache is built lazily from the "llm_cache" config section and rebuilt
+    if that section changes.
+    """
+    global _cache_instance, _cache_settings
+
+    cache_config = get_config_section("llm_cache")
+    if not cache_config.get("enabled", False):
+        return None
+
+    semantic_config = cache_config.get("semantic", {})
+    settings = (
+        cache_config.get("backend", "sqlite"),
+        cache_config.get("path"),
+        cache_config.get("max_entries", 50000),
+        cache_config.get("max_bytes"),
+        tuple(sorted(semantic_config.items())),
+    )
+    with _cache_lock:
+        if _cache_instance is None or settings != _cache_settings:
+            backend, path, max_entries, max_bytes, _ = settings
+            if backend == "sqlite":
+                store = SQLiteResultCache(path, max_entries, max_bytes)
+            elif backend == "memory":
+                store = MemoryResultCache(max_entries, max_bytes)
+            else:
+                raise ValueError(f"Unsupported LLM cache backend: {backend}")
+
+            semantic = None
+            if semantic_config.get("enabled", False):
+                semantic = SemanticIndex(
+                    store,
+                    get_embedding_client(get_config_section("embeddings")).embed_one,
+                    threshold=semantic_config.get("threshold", 0.97),
+                    max_candidates=semantic_config.get("max_candidates", 256),
+                    max_chars=semantic_config.get("max_chars", 16000),
+                )
+            _cache_instance = LLMResponseCache(store, semantic)
+            _cache_settings = settings
+        return _cache_instance
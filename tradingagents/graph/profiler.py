@@ -0,0 +1,366 @@
+# TradingAgents/graph/profiler.py
+
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Fields aggregated per node by summarize_profiles
+PROFILE_METRICS = [
+    "wall_time",
+    "llm_time",
+    "tool_time",
+    "prompt_tokens",
+    "cached_prompt_tokens",
+    "completion_tokens",
+    "llm_calls",
+    "tool_calls",
+    "retries",
+]
+PERCENTILES = [50, 90, 99]
+
+_run_ids = itertools.count(1)
+
+
+class NodeRecord:
+    """Timings and token counts for one invocation of one graph node."""
+
+    def __init__(self, node: str, start: float):
+        self.node = node
+        self.start = start
+        self.end = None
+        self.error = None
+        self.llm_time = 0.0
+        self.tool_time = 0.0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self.llm_calls = 0
+        self.tool_calls = 0
+        self.retries = 0
+        # (kind, name, start, end) of the LLM and tool calls made by the node
+        self.events = []
+
+    @property
+    def wall_time(self) -> float:
+        return (self.end if self.end is not None else self.start) - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {"node": self.node, "start": self.start, "end": self.end, "error": self.error}
+        for metric in PROFILE_METRICS:
+            record[metric] = getattr(self, metric)
+        return record
+
+
+class RunProfile:
+    """All node invocations of one graph run, in start order."""
+
+    def __init__(self, ticker: str, trade_date: str):
+        self.run_id = next(_run_ids)
+        self.ticker = ticker
+        self.trade_date = str(trade_date)
+        self.start_time = time.time()
+        self._origin = time.perf_counter()
+        self.records: List[NodeRecord] = []
+
+    @property
+    def wall_time(self) -> float:
+        ends = [record.end for record in self.records if record.end is not None]
+        return max(ends) - self._origin if ends else 0.0
+
+    def totals(self) -> Dict[str, Any]:
+        """Sum every metric over the run; wall_time is the run's elapsed time."""
+        totals = {
+            metric: sum(getattr(record, metric) for record in self.records)
+            for metric in PROFILE_METRICS
+        }
+        totals["wall_time"] = self.wall_time
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "ticker": self.ticker,
+            "trade_date": self.trade_date,
+            "start_time": self.start_time,
+            "totals": self.totals(),
+            "nodes": [
+                dict(
+                    record.to_dict(),
+                    start=record.start - self._origin,
+                    end=None if record.end is None else record.end - self._origin,
+                )
+                for record in self.records
+            ],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the run as a Chrome trace (load it in chrome://tracing or Perfetto).
+
+        Every node gets its own track, with its LLM and tool calls nested
+        underneath the node's slice.
+        """
+        tracks = {}
+        events = []
+
+        def micros(timestamp):
+            return (timestamp - self._origin) * 1e6
+
+        for record in self.records:
+            if record.node not in tracks:
+                tracks[record.node] = len(tracks) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self.run_id,
+                        "tid": tracks[record.node],
+                        "args": {"name": record.node},
+                    }
+                )
+            tid = tracks[record.node]
+            end = record.end if record.end is not None else record.start
+            args = record.to_dict()
+            del args["start"], args["end"]
+            events.append(
+                {
+                    "name": record.node,
+                    "cat": "node",
+                    "ph": "X",
+                    "ts": micros(record.start),
+                    "dur": (end - record.start) * 1e6,
+                    "pid": self.run_id,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+            for kind, name, start, call_end in record.events:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": kind,
+                        "ph": "X",
+                        "ts": micros(start),
+                        "dur": (call_end - start) * 1e6,
+                        "pid": self.run_id,
+                        "tid": tid,
+                    }
+                )
+
+        events.insert(
+            0,
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.run_id,
+                "args": {"name": f"{self.ticker} {self.trade_date}"},
+            },
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str):
+        """Write the Chrome trace of the run to a JSON file."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+class NodeProfiler(BaseCallbackHandler):
+    """Callback handler that attributes LLM, tool and retry events to graph nodes.
+
+    LangGraph tags every run inside a node with the node's name in the
+    "langgraph_node" metadata key. The run whose own name matches that key is
+    the node invocation itself; every run below it is charged to it by
+    following parent run ids.
+    """
+
+    # Record timestamps when the event happens, not when a worker gets to it
+    run_inline = True
+
+    def __init__(self, ticker: str, trade_date: str):
+        self.profile = RunProfile(ticker, trade_date)
+        self._lock = threading.Lock()
+        self._node_runs = {}  # run id of a node invocation -> its NodeRecord
+        self._owners = {}  # run id -> NodeRecord the run is charged to
+        self._open_calls = {}  # run id -> (kind, name, start) of an LLM or tool call
+
+    def _owner(self, run_id, parent_run_id) -> Optional[NodeRecord]:
+        owner = self._owners.get(parent_run_id)
+        if owner is not None:
+            self._owners[run_id] = owner
+        return owner
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        now = time.perf_counter()
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            if node is not None and kwargs.get("name") == node and parent_run_id not in self._owners:
+                record = NodeRecord(node, now)
+                self.profile.records.append(record)
+                self._node_runs[run_id] = record
+                self._owners[run_id] = record
+            else:
+                self._owner(run_id, parent_run_id)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end_chain(run_id, None)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end_chain(run_id, error)
+
+    def _end_chain(self, run_id, error):
+        now = time.perf_counter()
+        with self._lock:
+            self._owners.pop(run_id, None)
+            record = self._node_runs.pop(run_id, None)
+            if record is not None:
+                record.end = now
+                if error is not None:
+                    record.error = repr(error)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, **kwargs):
+        self._start_call("llm", run_id, parent_run_id, kwargs.get("name") or _model_name(serialized))
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, **kwargs):
+        self._start_call("llm", run_id, parent_run_id, kwargs.get("name") or _model_name(serialized))
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        prompt_tokens, cached_tokens, completion_tokens = _token_usage(response)
+        record = self._end_call(run_id)
+        if record is not None:
+            with self._lock:
+                record.prompt_tokens += prompt_tokens
+                record.cached_prompt_tokens += cached_tokens
+                record.completion_tokens += completion_tokens
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end_call(run_id)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+        self._start_call("tool", run_id, parent_run_id, kwargs.get("name") or (serialized or {}).get("name", "tool"))
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end_call(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end_call(run_id)
+
+    def on_retry(self, retry_state, *, run_id, parent_run_id=None, **kwargs):
+        with self._lock:
+            record = self._owners.get(run_id) or self._owners.get(parent_run_id)
+            if record is not None:
+                record.retries += 1
+
+    def _start_call(self, kind, run_id, parent_run_id, name):
+        now = time.perf_counter()
+        with self._lock:
+            if self._owner(run_id, parent_run_id) is not None:
+                self._open_calls[run_id] = (kind, name, now)
+
+    def _end_call(self, run_id) -> Optional[NodeRecord]:
+        now = time.perf_counter()
+        with self._lock:
+            record = self._owners.pop(run_id, None)
+            call = self._open_calls.pop(run_id, None)
+            if record is None or call is None:
+                return record
+            kind, name, start = call
+            if kind == "llm":
+                record.llm_time += now - start
+                record.llm_calls += 1
+            else:
+                record.tool_time += now - start
+                record.tool_calls += 1
+            record.events.append((kind, name, start, now))
+            return record
+
+
+def _model_name(serialized) -> str:
+    serialized = serialized or {}
+    model = (serialized.get("kwargs") or {}).get("model") or (serialized.get("kwargs") or {}).get("model_name")
+    if model:
+        return model
+    return (serialized.get("id") or ["llm"])[-1]
+
+
+def _token_usage(response):
+    """Return (prompt_tokens, cached_prompt_tokens, completion_tokens) reported by a model response.
+
+    Cached prompt tokens are the part of the prompt served from the
+    provider's prompt cache; they are included in prompt_tokens.
+    """
+    prompt_tokens = cached_tokens = completion_tokens = 0
+    found = False
+    for generations in response.generations or []:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                cached_tokens += (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+                completion_tokens += usage.get("output_tokens", 0)
+                found = True
+    if found:
+        return prompt_tokens, cached_tokens, completion_tokens
+
+    # Providers that do not fill usage_metadata report totals in llm_output
+    usage = (response.llm_output or {}).get("token_usage") or (response.llm_output or {}).get("usage") or {}
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or usage.get("cache_read_input_tokens")
+    return (
+        usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0,
+        cached or 0,
+        usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0,
+    )
+
+
+def summarize_profiles(profiles: List[RunProfile]) -> Dict[str, Any]:
+    """Aggregate run profiles into per-node and per-run percentile statistics.
+
+    Every node invocation is one sample, so a node that runs several times per
+    graph run (debaters, tool nodes) contributes one sample per invocation.
+
+    Returns:
+        dict with "nodes" (node name -> metric -> stats) and "runs"
+        (metric -> stats over whole-run totals). Each stats dict holds count,
+        mean, p50, p90, p99, max and total.
+    """
+    by_node = {}
+    for profile in profiles:
+        for record in profile.records:
+            by_node.setdefault(record.node, []).append(record)
+
+    nodes = {
+        node: {
+            metric: _stats([getattr(record, metric) for record in records])
+            for metric in PROFILE_METRICS
+        }
+        for node, records in by_node.items()
+    }
+    # Slowest nodes first
+    nodes = dict(sorted(nodes.items(), key=lambda item: item[1]["wall_time"]["total"], reverse=True))
+
+    run_totals = [profile.totals() for profile in profiles]
+    runs = {
+        metric: _stats([totals[metric] for totals in run_totals])
+        for metric in PROFILE_METRICS
+    }
+    return {"nodes": nodes, "runs": runs}
+
+
+def _stats(values) -> Dict[str, float]:
+    if not values:
+        return {"count": 0}
+    array = np.asarray(values, dtype=np.float64)
+    stats = {
+        "count": len(array),
+        "mean": float(array.mean()),
+        "max": float(array.max()),
+        "total": float(array.sum()),
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(array, PERCENTILES)):
+        stats[f"p{percentile}"] = float(value)
+    return stats
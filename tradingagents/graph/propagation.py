@@ -24,11 +24,21 @@ class Propagator:
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
+                {
+                    "history": "",
+                    "turns": [],
+                    "summary": "",
+                    "summarized_turns": 0,
+                    "current_response": "",
+                    "count": 0,
+                }
             ),
             "risk_debate_state": RiskDebateState(
                 {
                     "history": "",
+                    "turns": [],
+                    "summary": "",
+                    "summarized_turns": 0,
                     "current_risky_response": "",
                     "current_safe_response": "",
                     "current_neutral_response": "",
@@ -41,9 +51,15 @@ class Propagator:
             "news_report": "",
         }
 
-    def get_graph_args(self) -> Dict[str, Any]:
-        """Get arguments for the graph invocation."""
+    def get_graph_args(self, callbacks=None) -> Dict[str, Any]:
+        """Get arguments for the graph invocation.
+
+        callbacks, if given, are attached to every node of the run.
+        """
+        config = {"recursion_limit": self.max_recur_limit}
+        if callbacks:
+            config["callbacks"] = callbacks
         return {
             "stream_mode": "values",
-            "config": {"recursion_limit": self.max_recur_limit},
+            "config": config,
         }
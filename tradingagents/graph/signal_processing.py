@@ -1,7 +1,75 @@
 # TradingAgents/graph/signal_processing.py
 
+import logging
+import re
+from typing import Optional, Tuple
+
 from langchain_openai import ChatOpenAI
 
+from tradingagents.dataflows.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# "Buy-side" or "Holdings" are not decisions
+_DECISION = r"\**\s*(buy|sell|hold)(?![-\w])\s*\**"
+
+# (confidence, pattern) from most to least explicit; every pattern captures the decision
+SIGNAL_RULES = [
+    # The marker the trader and analyst prompts require, with or without bold
+    (1.0, re.compile(r"final\s+transaction\s+proposal\s*\**\s*[:\-–—]?\s*" + _DECISION, re.IGNORECASE)),
+    # "Final Recommendation: **Sell**", "Decision - Hold", "**Recommendation:** Buy"
+    (
+        0.9,
+        re.compile(
+            r"(?:final\s+|overall\s+|my\s+)?(?:recommendation|decision|verdict|call|action|rating|stance)"
+            r"\s*\**\s*[:\-–—]\s*" + _DECISION,
+            re.IGNORECASE,
+        ),
+    ),
+    # "I recommend a Hold", "we should sell", "recommend selling"
+    (
+        0.8,
+        re.compile(
+            r"\b(?:i|we)\s+(?:strongly\s+)?(?:recommend|advise|suggest|should)\s+(?:a\s+|to\s+)?\**\s*"
+            r"(buy|sell|hold)(?:ing)?(?![-\w])",
+            re.IGNORECASE,
+        ),
+    ),
+    # A bold decision on its own, as in "**BUY**"; too weak to be trusted without the LLM
+    (0.6, re.compile(r"\*\*\s*(BUY|SELL|HOLD)\s*\*\*")),
+]
+
+# Applied when an earlier statement names a different decision
+CONFLICT_PENALTY = 0.7
+
+
+def parse_signal(full_signal: str) -> Tuple[Optional[str], float]:
+    """Extract BUY, SELL or HOLD from a trading signal without calling a model.
+
+    The last decision stated in the text wins, whichever rule found it,
+    since reports quote earlier proposals (the trader's plan) before
+    concluding. The confidence is the weight of the most explicit rule that
+    matched that statement, reduced when any earlier statement names
+    another decision.
+
+    Returns:
+        (decision, confidence), or (None, 0.0) when no rule matches
+    """
+    statements = {}  # position of the decision word -> (confidence, decision)
+    for confidence, pattern in SIGNAL_RULES:
+        for match in pattern.finditer(full_signal):
+            position = match.start(1)
+            if confidence > statements.get(position, (0.0, None))[0]:
+                statements[position] = (confidence, match.group(1).upper())
+    if not statements:
+        return None, 0.0
+
+    ordered = [statements[position] for position in sorted(statements)]
+    confidence, decision = ordered[-1]
+    if any(other != decision for _, other in ordered[:-1]):
+        confidence *= CONFLICT_PENALTY
+    return decision, confidence
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -14,18 +82,47 @@ class SignalProcessor:
         """
         Process a full trading signal to extract the core decision.
 
+        The rule-based parser is tried first; the LLM is only asked when its
+        confidence is below the "signal_parser" min_confidence setting.
+
         Args:
             full_signal: Complete trading signal text
 
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
+        decision = self._parse(full_signal)
+        if decision is not None:
+            return decision
+        return self.quick_thinking_llm.invoke(self._get_messages(full_signal)).content
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async counterpart of process_signal."""
+        decision = self._parse(full_signal)
+        if decision is not None:
+            return decision
+        result = await self.quick_thinking_llm.ainvoke(self._get_messages(full_signal))
+        return result.content
+
+    def _parse(self, full_signal: str) -> Optional[str]:
+        """Return the parsed decision, or None if the LLM should extract it instead."""
+        parser_config = get_config().get("signal_parser", {})
+        decision, confidence = parse_signal(full_signal)
+        if confidence >= parser_config.get("min_confidence", 0.75):
+            return decision
+        if not parser_config.get("llm_fallback", True):
+            return decision or "HOLD"
+        logger.debug(
+            "Signal parser unsure (%s, confidence %.2f), asking the LLM", decision, confidence
+        )
+        return None
+
+    def _get_messages(self, full_signal: str):
+        """Build the extraction prompt for a full trading signal."""
+        return [
             (
                 "system",
                 "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
             ),
             ("human", full_signal),
         ]
-
-        return self.quick_thinking_llm.invoke(messages).content
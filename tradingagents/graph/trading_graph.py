@@ -3,6 +3,9 @@
 import os
 from pathlib import Path
 import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
@@ -41,6 +44,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .profiler import NodeProfiler
+from .llm_cache import get_llm_response_cache
 
 
 class TradingAgentsGraph:
@@ -72,24 +77,19 @@ class TradingAgentsGraph:
         )
 
         # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
-        
+        self.deep_thinking_llm, self.quick_thinking_llm = self._create_llms()
+        self.llm_cache = get_llm_response_cache()
+        if self.llm_cache is not None:
+            # LangChain consults a model's cache before every call, tools and parameters included
+            self.deep_thinking_llm.cache = self.llm_cache
+            self.quick_thinking_llm.cache = self.llm_cache
+
         # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
+        self.bull_memory = self._create_memory("bull_memory")
+        self.bear_memory = self._create_memory("bear_memory")
+        self.trader_memory = self._create_memory("trader_memory")
+        self.invest_judge_memory = self._create_memory("invest_judge_memory")
+        self.risk_manager_memory = self._create_memory("risk_manager_memory")
 
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -115,10 +115,40 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
+        self.last_profile = None  # RunProfile of the last propagate call when profiling
         self.log_states_dict = {}  # date to full state dict
+        self.batch_log_states = {}  # ticker to {date: full state dict} for batch runs
+        self._log_lock = threading.Lock()
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+        )
+
+    def _create_llms(self):
+        """Create the (deep thinking, quick thinking) chat models for the configured provider."""
+        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
+            return (
+                ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"]),
+                ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"]),
+            )
+        elif self.config["llm_provider"].lower() == "anthropic":
+            return (
+                ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"]),
+                ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"]),
+            )
+        elif self.config["llm_provider"].lower() == "google":
+            return (
+                ChatGoogleGenerativeAI(model=self.config["deep_think_llm"]),
+                ChatGoogleGenerativeAI(model=self.config["quick_think_llm"]),
+            )
+        else:
+            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
+
+    def _create_memory(self, name):
+        """Create the reflection memory stored under the given collection name."""
+        return FinancialSituationMemory(name, self.config)
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
@@ -157,16 +187,41 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
-
-        self.ticker = company_name
-
+    def _new_profiler(self, company_name, trade_date):
+        """Return a NodeProfiler for one run, or None when profiling is disabled."""
+        if not self.config.get("profiling", {}).get("enabled", False):
+            return None
+        return NodeProfiler(company_name, trade_date)
+
+    def _finish_profile(self, profiler):
+        """Write the run's Chrome trace if a trace_dir is configured and return its profile."""
+        if profiler is None:
+            return None
+        profile = profiler.profile
+        trace_dir = self.config.get("profiling", {}).get("trace_dir")
+        if trace_dir:
+            profile.save(
+                os.path.join(
+                    trace_dir,
+                    f"{profile.ticker}_{profile.trade_date}_{profile.run_id}.json",
+                )
+            )
+        return profile
+
+    def _run_graph(self, company_name, trade_date, profiler=None):
+        """Run the graph once and return the final state.
+
+        Touches no instance attributes, so it is safe to call from several
+        threads sharing this graph, its LLM clients and the dataflow caches.
+        A profiler, if given, records the run's per-node timings.
+        """
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        args = self.propagator.get_graph_args(
+            callbacks=[profiler] if profiler is not None else None
+        )
 
         if self.debug:
             # Debug mode with tracing
@@ -178,10 +233,41 @@ class TradingAgentsGraph:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            return trace[-1]
+
+        # Standard mode without tracing
+        return self.graph.invoke(init_agent_state, **args)
+
+    async def _arun_graph(self, company_name, trade_date, profiler=None):
+        """Async counterpart of _run_graph, driven by graph.astream/ainvoke."""
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args(
+            callbacks=[profiler] if profiler is not None else None
+        )
+
+        if self.debug:
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    trace.append(chunk)
+
+            return trace[-1]
+
+        return await self.graph.ainvoke(init_agent_state, **args)
+
+    def propagate(self, company_name, trade_date):
+        """Run the trading agents graph for a company on a specific date."""
+
+        self.ticker = company_name
+
+        profiler = self._new_profiler(company_name, trade_date)
+        final_state = self._run_graph(company_name, trade_date, profiler)
+        self.last_profile = self._finish_profile(profiler)
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -192,9 +278,146 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+    async def apropagate(self, company_name, trade_date):
+        """Async counterpart of propagate.
+
+        Nodes call the LLMs through ainvoke and tools run through their async
+        implementations, so many runs can share one event loop. Like
+        propagate, this records the run as the current state for reflection;
+        use apropagate_batch to run several tickers concurrently.
+        """
+        self.ticker = company_name
+
+        profiler = self._new_profiler(company_name, trade_date)
+        final_state = await self._arun_graph(company_name, trade_date, profiler)
+        self.last_profile = self._finish_profile(profiler)
+
+        self.curr_state = final_state
+        self._log_state(trade_date, final_state)
+
+        return final_state, await self.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+
+    async def apropagate_batch(self, tickers, dates, max_concurrency=16):
+        """Async counterpart of propagate_batch on a single event loop.
+
+        At most max_concurrency jobs are in flight at once. Yields the same
+        result dicts as propagate_batch, in completion order.
+        """
+        if isinstance(dates, (str, date)):
+            dates = [dates]
+        jobs = [(ticker, trade_date) for trade_date in dates for ticker in tickers]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_job(ticker, trade_date):
+            async with semaphore:
+                profiler = self._new_profiler(ticker, trade_date)
+                try:
+                    final_state = await self._arun_graph(ticker, trade_date, profiler)
+                    with self._log_lock:
+                        ticker_log_states = self.batch_log_states.setdefault(ticker, {})
+                        self._log_state(
+                            trade_date, final_state, ticker, ticker_log_states
+                        )
+                    decision = await self.aprocess_signal(
+                        final_state["final_trade_decision"]
+                    )
+                    error = None
+                except Exception as e:
+                    final_state, decision, error = None, None, e
+            return {
+                "ticker": ticker,
+                "trade_date": str(trade_date),
+                "final_state": final_state,
+                "decision": decision,
+                "error": error,
+                "profile": self._finish_profile(profiler),
+            }
+
+        tasks = [asyncio.ensure_future(run_job(*job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def propagate_batch(self, tickers, dates, max_concurrency=4):
+        """Run the graph for many (ticker, date) jobs on a bounded thread pool.
+
+        Every ticker is run on every date. All jobs share this instance's LLM
+        clients, memories and dataflow caches, while each job gets its own
+        graph state. Results are yielded as soon as each job finishes, so
+        they arrive in completion order rather than submission order.
+
+        Args:
+            tickers: List of ticker symbols
+            dates: A single trade date or a list of trade dates
+            max_concurrency: Maximum number of jobs running at the same time
+
+        Yields:
+            dict with "ticker", "trade_date", "final_state", "decision",
+            "error" and "profile" keys. A failed job has final_state and
+            decision set to None and the raised exception in "error".
+            "profile" is the job's RunProfile when profiling is enabled, else
+            None; pass the profiles to summarize_profiles for batch stats.
+        """
+        if isinstance(dates, (str, date)):
+            dates = [dates]
+        jobs = [(ticker, trade_date) for trade_date in dates for ticker in tickers]
+
+        profilers = {job: self._new_profiler(*job) for job in jobs}
+
+        def run_job(ticker, trade_date):
+            final_state = self._run_graph(
+                ticker, trade_date, profilers[(ticker, trade_date)]
+            )
+            with self._log_lock:
+                ticker_log_states = self.batch_log_states.setdefault(ticker, {})
+                self._log_state(trade_date, final_state, ticker, ticker_log_states)
+            return final_state, self.process_signal(
+                final_state["final_trade_decision"]
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = {
+            executor.submit(run_job, ticker, trade_date): (ticker, trade_date)
+            for ticker, trade_date in jobs
+        }
+        try:
+            for future in as_completed(futures):
+                ticker, trade_date = futures[future]
+                try:
+                    final_state, decision = future.result()
+                    error = None
+                except Exception as e:
+                    final_state, decision, error = None, None, e
+                yield {
+                    "ticker": ticker,
+                    "trade_date": str(trade_date),
+                    "final_state": final_state,
+                    "decision": decision,
+                    "error": error,
+                    "profile": self._finish_profile(profilers[(ticker, trade_date)]),
+                }
+        finally:
+            # Drop queued jobs if the caller stops consuming early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _log_state(self, trade_date, final_state, ticker=None, log_states_dict=None):
+        """Log the final state to a JSON file.
+
+        Defaults to the single-run ticker and log; batch runs pass their own
+        ticker and per-ticker log so concurrent jobs never share one.
+        """
+        ticker = ticker or self.ticker
+        if log_states_dict is None:
+            log_states_dict = self.log_states_dict
+
+        log_states_dict[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -225,14 +448,14 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(log_states_dict, f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
@@ -255,3 +478,7 @@ class TradingAgentsGraph:
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Async counterpart of process_signal."""
+        return await self.signal_processor.aprocess_signal(full_signal)
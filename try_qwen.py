@@ -7,8 +7,6 @@ import yfinance as yf
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from dotenv import load_dotenv
-import time
-import random
 
 # ========= 加载 .env =========
 load_dotenv()
@@ -66,25 +64,32 @@ else:
 today = date(2025, 10, 30).strftime("%Y-%m-%d")
 records = []
 
-# ========= 遍历每只股票 =========
+# ========= 获取当前价格 =========
+prices = {}
 for ticker in TICKERS:
-    print(f"\n=== {ticker} ===")
-
-    # 获取当前价格
     data = yf.download(ticker, period="5d", interval="1d")
     if today not in data.index.strftime("%Y-%m-%d"):
         print(f"⚠️ 今天 {today} {ticker} 无数据，跳过。")
         continue
 
-    price = float(data.loc[data.index.strftime("%Y-%m-%d") == today]["Close"].values[0])
-    acc = accounts[ticker]
+    prices[ticker] = float(data.loc[data.index.strftime("%Y-%m-%d") == today]["Close"].values[0])
+
+# ========= 并发获取所有股票的决策 =========
+decisions = {}
+for result in ta.propagate_batch(list(prices), today, max_concurrency=4):
+    if result["error"] is not None:
+        print(f"⚠️ 股票 {result['ticker']} 决策调用失败: {result['error']}")
+        decisions[result["ticker"]] = "HOLD"
+    else:
+        print(f"✅ {result['ticker']} 决策: {result['decision']}")
+        decisions[result["ticker"]] = result["decision"]
 
-    # 调用 TA 内部 propagate（不要传额外参数）
-    try:
-        _, decision = ta.propagate(ticker, today)
-    except Exception as e:
-        print(f"⚠️ 股票 {ticker} 决策调用失败: {e}")
-        decision = "HOLD"
+# ========= 遍历每只股票 =========
+for ticker, price in prices.items():
+    print(f"\n=== {ticker} ===")
+
+    acc = accounts[ticker]
+    decision = decisions[ticker]
 
     # 执行交易逻辑
     if decision == "BUY" and not acc["in_position"]:
@@ -112,10 +117,6 @@ for ticker in TICKERS:
         "pnl_pct": pnl_pct,
     })
 
-    sleep_time = random.uniform(8, 10)
-    print(f"💤 等待 {sleep_time:.1f} 秒再处理下一支股票…")
-    time.sleep(sleep_time)
-
 # ========= 保存每只股票记录 =========
 file_exists = os.path.exists(RECORD_FILE)
 with open(RECORD_FILE, "a", newline="") as f: